@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from .decisions import Decision, PolicyDeniedError
 from .enforcement.wrapper import Enforcer, enforce_tool_call
-from .models import ToolCall
+from .models import ToolCall, ToolCallCore
 from .policy.engine import PolicyEngine
 
 __all__ = [
     "ToolCall",
+    "ToolCallCore",
     "Decision",
     "PolicyDeniedError",
     "PolicyEngine",
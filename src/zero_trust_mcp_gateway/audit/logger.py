@@ -1,18 +1,226 @@
 from __future__ import annotations
 
+import atexit
+import io
 import json
 import logging
-from dataclasses import dataclass
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO, Literal
 
-from ..redaction import DEFAULT_DENY_KEYS, redact_value
+import orjson
+
+from ..redaction import DEFAULT_DENY_KEYS, Redactor, deny_key_set, make_redactor
+
+OverflowPolicy = Literal["block", "drop"]
+
+DEFAULT_QUEUE_SIZE = 10_000
+BATCH_SIZE = 100
+
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# event field values shared by every audit event
+ACTION_TOOL_CALL = sys.intern("tool_call")
+DECISION_ALLOW = sys.intern("allow")
+DECISION_DENY = sys.intern("deny")
+DECISION_ERROR = sys.intern("error")
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp; replaced as a
+# whole so concurrent readers never see a torn pair
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp(ns: int) -> str:
+    """Format epoch nanoseconds as ISO-8601 UTC, rebuilding the date part once per second."""
+    global _ts_cache
+    sec, frac = divmod(ns, 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{frac // 1000:06d}Z"
+
+
+# fields written for an event that cannot be serialized at all
+_ENVELOPE_FIELDS = ("timestamp", "action", "tool_name", "decision", "reason", "policy_id", "actor", "request_id", "layer")
+
+
+def _dumps(event: dict[str, Any]) -> bytes:
+    """
+    Serialize one event. Never raises: an event that cannot be serialized as a
+    whole is written as its envelope fields with an "error" marker, so it cannot
+    take the other events of its batch down with it.
+    """
+    # events carry the raw time.time_ns() reading; format it off the request path
+    event["timestamp"] = _iso_timestamp(event["timestamp"])
+    try:
+        return orjson.dumps(event, default=str, option=_JSON_OPTIONS)
+    except TypeError:
+        pass  # orjson rejects ints wider than 64 bits and nesting deeper than 255 levels
+    try:
+        return json.dumps(event, default=str, ensure_ascii=False).encode("utf-8")
+    except (TypeError, ValueError, RecursionError):
+        envelope = {k: event[k] for k in _ENVELOPE_FIELDS if k in event}
+        envelope["error"] = "audit event not serializable"
+        return orjson.dumps(envelope, default=str)
+
+
+class AuditSink:
+    """
+    Direct binary writer for audit batches.
+
+    Bypasses logging's per-record LogRecord/Formatter/handler-lock machinery;
+    the flusher writes each serialized batch once and flushes at the batch boundary.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    @classmethod
+    def for_fd(cls, fd: int, buffer_size: int = 64 * 1024) -> AuditSink:
+        raw = io.FileIO(fd, "wb", closefd=False)
+        return cls(io.BufferedWriter(raw, buffer_size=buffer_size))
+
+    def write(self, payload: bytes) -> None:
+        self._stream.write(payload)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _stderr_sink() -> AuditSink | None:
+    try:
+        fd = sys.stderr.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None  # no real stderr (e.g. replaced by a capture object)
+    return AuditSink.for_fd(fd)
+
+
+class _Flusher:
+    """
+    Background writer for audit events.
+
+    Drains the event queue on a daemon thread and emits each batch as
+    newline-delimited JSON, so serialization and I/O stay off the request-serving
+    thread. Batches go to the sink if one is set; handlers attached to the logger
+    receive each batch as a single record.
+
+    A forked child does not inherit the writer thread, so every started flusher
+    gets a fresh queue and thread in the child (see _restart_after_fork).
+    """
+
+    def __init__(self, logger: logging.Logger, maxsize: int = DEFAULT_QUEUE_SIZE, sink: AuditSink | None = None):
+        self.logger = logger
+        self.sink = sink
+        self.maxsize = maxsize
+        self.queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run, args=(self.queue,), name=f"{self.logger.name}.flusher", daemon=True)
+        self._thread.start()
+        _started_flushers.add(self)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def put(self, event: dict[str, Any], *, block: bool = True) -> None:
+        if block:
+            self.queue.put(event)
+            return
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self, q: queue.Queue[dict[str, Any]]) -> None:
+        while True:
+            batch = [q.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            payload = b"\n".join(map(_dumps, batch))
+            try:
+                if self.sink is not None:
+                    self.sink.write(payload + b"\n")
+                    self.sink.flush()
+                if self.sink is None or self.logger.handlers:
+                    self.logger.info(payload.decode("utf-8"))
+            except Exception:
+                # a failing sink or handler must never take the writer thread down with it
+                self.logger.exception("Failed to write audit batch")
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        if self.is_alive():
+            self.queue.join()
+
+    def _restart(self) -> None:
+        # events still queued at fork time belong to the parent, which writes them;
+        # the old queue's locks may have been held by the parent's writer thread
+        self.queue = queue.Queue(maxsize=self.maxsize)
+        self.dropped = 0
+        self.start()
+
+
+_flushers: dict[str, _Flusher] = {}
+_flushers_lock = threading.Lock()
+_started_flushers: weakref.WeakSet[_Flusher] = weakref.WeakSet()
+
+
+def _restart_after_fork() -> None:
+    global _flushers_lock
+    _flushers_lock = threading.Lock()
+    for flusher in list(_started_flushers):
+        flusher._restart()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def _flush_all() -> None:
+    for flusher in list(_flushers.values()):
+        flusher.flush()
+
+
+atexit.register(_flush_all)
 
 
 @dataclass(slots=True)
 class AuditLogger:
+    """
+    Structured audit logger.
+
+    When created via get_audit_logger(), events are queued and written in batches
+    by a background thread; call flush() to wait for pending events. Without a
+    flusher, events are written synchronously.
+
+    overflow controls what happens when the queue is full:
+      - "block": wait for room (no events are lost)
+      - "drop": discard the event and count it in flusher.dropped
+    """
+
     logger: logging.Logger
-    deny_keys: list[str]
+    deny_keys: frozenset[str]
+    overflow: OverflowPolicy = "block"
+    flusher: _Flusher | None = None
+    _redact: Redactor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._redact = make_redactor(deny_keys=self.deny_keys)
 
     def log(
         self,
@@ -32,10 +240,10 @@ class AuditLogger:
         include_result: bool = False,
         include_argument_values: bool = False,
     ) -> None:
-        ts = datetime.now(timezone.utc).isoformat()
+        ts = time.time_ns()
 
         args = arguments or {}
-        args_summary = {"keys": sorted(list(args.keys())), "key_count": len(args.keys())}
+        args_summary = {"keys": sorted(args), "key_count": len(args)}
 
         event: dict[str, Any] = {
             "timestamp": ts,
@@ -44,32 +252,77 @@ class AuditLogger:
             "decision": decision,
             "reason": reason,
             "policy_id": policy_id,
-            "actor": actor,
-            "request_id": request_id,
-            "layer": layer,
-            "latency_ms": latency_ms,
-            "arguments_summary": args_summary,
         }
 
+        # optional fields are only added when set, instead of filtering Nones afterwards
+        if actor is not None:
+            event["actor"] = actor
+        if request_id is not None:
+            event["request_id"] = request_id
+        if layer is not None:
+            event["layer"] = layer
+        if latency_ms is not None:
+            event["latency_ms"] = latency_ms
+
+        event["arguments_summary"] = args_summary
+
         if client is not None:
-            event["client"] = redact_value(client, deny_keys=self.deny_keys)
+            event["client"] = self._redact(client)
 
         if include_argument_values:
-            event["arguments"] = redact_value(args, deny_keys=self.deny_keys)
+            event["arguments"] = self._redact(args)
 
         if include_result and result is not None:
-            event["result"] = redact_value(result, deny_keys=self.deny_keys)
+            event["result"] = self._redact(result)
+
+        if self.flusher is None:
+            self.logger.info(_dumps(event).decode("utf-8"))
+        else:
+            self.flusher.put(event, block=self.overflow == "block")
 
-        event = {k: v for k, v in event.items() if v is not None}
-        self.logger.info(json.dumps(event, ensure_ascii=False))
+    def flush(self) -> None:
+        """Wait until all queued events have been written."""
+        if self.flusher is not None:
+            self.flusher.flush()
 
 
-def get_audit_logger(name: str = "zero_trust_mcp.audit") -> AuditLogger:
+def get_audit_logger(
+    name: str = "zero_trust_mcp.audit",
+    *,
+    overflow: OverflowPolicy = "block",
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> AuditLogger:
+    """
+    Audit logger with a background writer.
+
+    If the named logger has no handlers yet, batches are written straight to stderr
+    through an AuditSink (the logger stops propagating; handlers added to it later
+    still receive events). Otherwise they go through the existing handlers.
+    """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
     logger.setLevel(logging.INFO)
-    return AuditLogger(logger=logger, deny_keys=DEFAULT_DENY_KEYS)
+
+    # one writer thread per logger name; queue_size applies when it is first created
+    with _flushers_lock:
+        flusher = _flushers.get(name)
+        if flusher is None:
+            sink = None
+            if not logger.handlers:
+                sink = _stderr_sink()
+                if sink is None:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter("%(message)s")
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                else:
+                    logger.propagate = False
+            flusher = _Flusher(logger, maxsize=queue_size, sink=sink)
+            flusher.start()
+            _flushers[name] = flusher
+
+    return AuditLogger(
+        logger=logger,
+        deny_keys=deny_key_set(DEFAULT_DENY_KEYS),
+        overflow=overflow,
+        flusher=flusher,
+    )
@@ -10,37 +10,72 @@ from ..layers.detect_attacks import detect_attacks_layer
 from ..layers.rate_limit import rate_limit_layer
 from ..layers.redact import redact_layer
 from ..layers.validate import validate_layer
-from ..models import ToolCall
+from ..models import AnyToolCall, ToolCallCore
+from ..pipeline.context import LayerFunc
 from ..pipeline.pipeline import Pipeline
 from ..policy.engine import PolicyEngine
-from ..rate_limit import InMemoryRateLimiter
+from ..rate_limit import InMemoryRateLimiter, RateLimiter
 
 
 class Enforcer:
     """
     Backward-compatible: enforcer.enforce(call, tool_fn) -> result
     Denials raise PolicyDeniedError.
+
+    rate_limiter defaults to a per-process InMemoryRateLimiter; pass a shared
+    RateLimiter implementation when several workers must share one limit.
     """
 
-    def __init__(self, engine: PolicyEngine, audit_logger: AuditLogger | None = None):
+    def __init__(
+        self,
+        engine: PolicyEngine,
+        audit_logger: AuditLogger | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+    ):
         self.engine = engine
         self.audit_logger = audit_logger
-        self._limiter = InMemoryRateLimiter()
-
-    def enforce(self, tool_call: ToolCall, tool_fn: Callable[..., Any]) -> Any:
+        self._limiter = rate_limiter if rate_limiter is not None else InMemoryRateLimiter()
+        # the policy is fixed for the lifetime of an Enforcer, so compose the pipeline once
+        # only the audit layer reports latency; skip the clock read when it is absent
+        self._pipeline = Pipeline(engine=engine, layers=self._build_layers(), timed=self._audit_enabled())
+
+    def _audit_enabled(self) -> bool:
+        audit = self.engine.policy.audit
+        return self.audit_logger is not None and (audit is None or audit.enabled)
+
+    def _build_layers(self) -> list[LayerFunc]:
+        """
+        Layers in execution order. Layers whose config makes them a no-op are left out,
+        so they cost nothing per call; the predicates mirror each layer's runtime check.
+        """
         policy = self.engine.policy
+        layers: list[LayerFunc] = []
+
+        vcfg = policy.validate_cfg
+        if vcfg is not None and vcfg.max_arg_bytes:
+            layers.append(validate_layer(policy.policy_id, vcfg))
+
+        rl = policy.rate_limit
+        if rl is not None and rl.enabled and rl.limit_per_minute:
+            layers.append(rate_limit_layer(policy.policy_id, rl, self._limiter))
+
+        layers.append(authorize_layer(self.engine))
+
+        da = policy.detect_attacks
+        if da is not None and da.enabled and da.on_detect == "deny":
+            layers.append(detect_attacks_layer(policy.policy_id, da))
+
+        if policy.redact is not None and policy.redact.enabled:
+            layers.append(redact_layer(policy.redact))
+
+        if self._audit_enabled():
+            layers.append(audit_layer(self.audit_logger, policy.audit))
 
-        layers = [
-            validate_layer(policy.policy_id, policy.validate_cfg),
-            rate_limit_layer(policy.policy_id, policy.rate_limit, self._limiter),
-            authorize_layer(self.engine),
-            detect_attacks_layer(policy.policy_id, policy.detect_attacks),
-            redact_layer(policy.redact),
-            audit_layer(self.audit_logger, policy.audit),
-        ]
+        return layers
 
-        pipeline = Pipeline(engine=self.engine, layers=layers)
-        return pipeline.execute(tool_call, tool_fn)
+    def enforce(self, tool_call: AnyToolCall, tool_fn: Callable[..., Any]) -> Any:
+        return self._pipeline.execute(tool_call, tool_fn)
 
 
 def _callable_name(fn: Callable[..., Any]) -> str:
@@ -54,18 +89,24 @@ def _callable_name(fn: Callable[..., Any]) -> str:
     return fn.__class__.__name__
 
 
-def enforce_tool_call(engine: PolicyEngine, audit_logger: AuditLogger | None = None):
+def enforce_tool_call(
+    engine: PolicyEngine,
+    audit_logger: AuditLogger | None = None,
+    *,
+    rate_limiter: RateLimiter | None = None,
+):
     """
     Decorator style.
     """
-    enforcer = Enforcer(engine, audit_logger)
+    enforcer = Enforcer(engine, audit_logger, rate_limiter=rate_limiter)
 
     def decorator(fn: Callable[..., Any]):
         tool_name = _callable_name(fn)
 
         def wrapped(**kwargs: Any) -> Any:
-            call = ToolCall(tool_name=tool_name, arguments=dict(kwargs))
-            return enforcer.enforce(call, fn)
+            # **kwargs is already a fresh dict owned by this call and tool_name comes from
+            # the function itself, so skip ToolCall validation and build the core directly
+            return enforcer.enforce(ToolCallCore(tool_name=tool_name, arguments=kwargs), fn)
 
         return wrapped
 
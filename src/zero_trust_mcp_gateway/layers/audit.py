@@ -2,8 +2,15 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
-from ..audit.logger import AuditLogger
+from ..audit.logger import (
+    ACTION_TOOL_CALL,
+    DECISION_ALLOW,
+    DECISION_DENY,
+    DECISION_ERROR,
+    AuditLogger,
+)
 from ..pipeline.context import CallContext
+from ..pipeline.pipeline import Pipeline
 from ..policy.schema import AuditConfig
 
 
@@ -12,10 +19,11 @@ def audit_layer(audit_logger: AuditLogger | None, cfg: AuditConfig | None):
         try:
             out = nxt()
             if audit_logger and (cfg is None or cfg.enabled):
+                ctx.meta["latency_ms"] = Pipeline.latency_ms(ctx.start_ns)
                 audit_logger.log(
-                    action="tool_call",
+                    action=ACTION_TOOL_CALL,
                     tool_name=ctx.tool_call.tool_name,
-                    decision="allow",
+                    decision=DECISION_ALLOW,
                     reason=(ctx.decision.reason if ctx.decision else "Allowed"),
                     policy_id=ctx.policy_id,
                     actor=ctx.tool_call.actor,
@@ -31,10 +39,11 @@ def audit_layer(audit_logger: AuditLogger | None, cfg: AuditConfig | None):
             return out
         except Exception as e:
             if audit_logger and (cfg is None or cfg.enabled):
+                ctx.meta["latency_ms"] = Pipeline.latency_ms(ctx.start_ns)
                 audit_logger.log(
-                    action="tool_call",
+                    action=ACTION_TOOL_CALL,
                     tool_name=ctx.tool_call.tool_name,
-                    decision="deny" if (ctx.decision and not ctx.decision.allowed) else "error",
+                    decision=DECISION_DENY if (ctx.decision and not ctx.decision.allowed) else DECISION_ERROR,
                     reason=(ctx.decision.reason if ctx.decision else str(e)),
                     policy_id=ctx.policy_id,
                     actor=ctx.tool_call.actor,
@@ -9,7 +9,7 @@ from ..policy.engine import PolicyEngine
 
 def authorize_layer(engine: PolicyEngine):
     def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
-        decision = engine.evaluate(ctx.tool_call)
+        decision = engine.evaluate(ctx.tool_call, arguments_size=ctx.meta.get("args_size"))
         ctx.decision = decision
         ctx.layer = decision.layer or "authorize"
         if not decision.allowed:
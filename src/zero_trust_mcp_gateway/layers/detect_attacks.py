@@ -1,39 +1,56 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Callable, Iterable
+from typing import Any, Callable
 
 from ..decisions import Decision, PolicyDeniedError
 from ..pipeline.context import CallContext
 from ..policy.schema import DetectAttacksConfig
+from ..redaction import SCALAR_TYPES
 
-SQLI_RE = re.compile(r"(?i)\b(select|union|insert|update|delete|drop|alter)\b")
-TRAVERSAL_RE = re.compile(r"(\.\./|\.\.\\)")
-SSRF_RE = re.compile(r"(?i)\b(169\.254\.169\.254|localhost|127\.0\.0\.1)\b")
+# SQLi keywords | SSRF targets | path traversal, fused so each string is scanned once
+ATTACK_RE = re.compile(
+    r"(?i)\b(?:select|union|insert|update|delete|drop|alter"
+    r"|169\.254\.169\.254|localhost|127\.0\.0\.1)\b"
+    r"|\.\.[\\/]"
+)
 
 
-def _collect_strings(obj: Any, keys_of_interest: set[str]) -> Iterable[str]:
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if isinstance(k, str) and k in keys_of_interest and isinstance(v, str):
-                yield v
-            yield from _collect_strings(v, keys_of_interest)
-    elif isinstance(obj, list):
-        for v in obj:
-            yield from _collect_strings(v, keys_of_interest)
+def _has_attack(obj: Any, keys_of_interest: frozenset[str]) -> bool:
+    """
+    Scan string values stored under keys_of_interest, at any depth, for attack patterns.
+    Iterative walk that searches each string as it is found (no intermediate list).
+    """
+    search = ATTACK_RE.search
+    stack = [obj]
+    seen: set[int] = set()  # containers already scanned (also guards against cycles)
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen:
+            continue
+        if isinstance(cur, dict):
+            seen.add(id(cur))
+            for k, v in cur.items():
+                if isinstance(v, str):
+                    # isinstance, not type(): str subclasses must not slip past detection
+                    if isinstance(k, str) and k in keys_of_interest and search(v):
+                        return True
+                elif type(v) not in SCALAR_TYPES:
+                    stack.append(v)
+        elif isinstance(cur, list):
+            seen.add(id(cur))
+            stack.extend(cur)
+    return False
 
 
 def detect_attacks_layer(policy_id: str, cfg: DetectAttacksConfig | None):
+    fields = frozenset(cfg.fields or []) if cfg is not None else frozenset()
+
     def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
         if cfg is None or not cfg.enabled:
             return nxt()
 
-        fields = set(cfg.fields or [])
-        haystacks = list(_collect_strings(ctx.tool_call.arguments or {}, fields))
-
-        suspicious = any(SQLI_RE.search(s) or TRAVERSAL_RE.search(s) or SSRF_RE.search(s) for s in haystacks)
-
-        if suspicious and cfg.on_detect == "deny":
+        if cfg.on_detect == "deny" and _has_attack(ctx.tool_call.arguments or {}, fields):
             decision = Decision(
                 allowed=False,
                 reason="Potential injection/abuse pattern detected in arguments",
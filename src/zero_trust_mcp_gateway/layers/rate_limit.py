@@ -3,34 +3,50 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from ..decisions import Decision, PolicyDeniedError
+from ..models import ToolCallCore
 from ..pipeline.context import CallContext
 from ..policy.schema import RateLimitConfig
-from ..rate_limit import InMemoryRateLimiter
+from ..rate_limit import InMemoryRateLimiter, RateLimiter
 
 
-def rate_limit_layer(policy_id: str, cfg: RateLimitConfig | None, limiter: InMemoryRateLimiter | None = None):
-    limiter = limiter or InMemoryRateLimiter()
+def _key_global(tc: ToolCallCore) -> str:
+    return "global"
+
+
+def _key_actor(tc: ToolCallCore) -> str:
+    return f"actor:{tc.actor or 'unknown'}"
+
+
+def _key_session(tc: ToolCallCore) -> str:
+    return f"session:{(tc.client or {}).get('session_id', 'unknown')}"
+
+
+def _key_tool(tc: ToolCallCore) -> str:
+    return f"tool:{tc.tool_name}"
 
-    def _key(ctx: CallContext) -> str:
-        tc = ctx.tool_call
-        if cfg is None:
-            return "global"
-        if cfg.scope == "actor":
-            return f"actor:{tc.actor or 'unknown'}"
-        if cfg.scope == "session":
-            sid = (tc.client or {}).get("session_id", "unknown")
-            return f"session:{sid}"
-        if cfg.scope == "tool":
-            return f"tool:{tc.tool_name}"
-        if cfg.scope == "actor+tool":
-            return f"actor:{tc.actor or 'unknown'}:tool:{tc.tool_name}"
-        return "global"
+
+def _key_actor_tool(tc: ToolCallCore) -> str:
+    return f"actor:{tc.actor or 'unknown'}:tool:{tc.tool_name}"
+
+
+_KEY_BUILDERS: dict[str, Callable[[ToolCallCore], str]] = {
+    "actor": _key_actor,
+    "session": _key_session,
+    "tool": _key_tool,
+    "actor+tool": _key_actor_tool,
+}
+
+
+def rate_limit_layer(policy_id: str, cfg: RateLimitConfig | None, limiter: RateLimiter | None = None):
+    limiter = limiter or InMemoryRateLimiter()
+    # scope is fixed per policy, so pick the key builder once
+    _key = _KEY_BUILDERS.get(cfg.scope, _key_global) if cfg is not None else _key_global
 
     def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
         if cfg is None or not cfg.enabled or not cfg.limit_per_minute:
             return nxt()
 
-        ok, meta = limiter.allow(_key(ctx), cfg.limit_per_minute, cfg.burst)
+        ok, meta = limiter.allow(_key(ctx.tool_call), cfg.limit_per_minute, cfg.burst)
         ctx.meta["rate_limit"] = meta
         if not ok:
             decision = Decision(
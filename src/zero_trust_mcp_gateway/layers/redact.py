@@ -4,22 +4,26 @@ from typing import Any, Callable
 
 from ..pipeline.context import CallContext
 from ..policy.schema import RedactConfig
-from ..redaction import redact_value
+from ..redaction import make_redactor
 
 
 def redact_layer(cfg: RedactConfig | None):
-    def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
-        out = nxt()
-        if cfg is None or not cfg.enabled:
-            return out
-
-        redacted = redact_value(
-            out,
+    # resolve deny keys and the PII scrubber once per policy, not per call
+    redact = None
+    if cfg is not None and cfg.enabled:
+        redact = make_redactor(
             deny_keys=cfg.deny_keys,
             pii_emails=cfg.pii_emails,
             pii_phones=cfg.pii_phones,
             max_string_len=cfg.max_string_len,
         )
+
+    def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
+        out = nxt()
+        if redact is None:
+            return out
+
+        redacted = redact(out)
         ctx.tool_result = redacted
         return redacted
 
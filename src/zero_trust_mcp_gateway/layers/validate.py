@@ -1,30 +1,39 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, NoReturn
 
 from ..decisions import Decision, PolicyDeniedError
+from ..models import measure_arguments
 from ..pipeline.context import CallContext
 from ..policy.schema import ValidateConfig
 
 
 def validate_layer(policy_id: str, cfg: ValidateConfig | None):
+    def _deny(ctx: CallContext, reason: str, remediation: str) -> NoReturn:
+        decision = Decision(
+            allowed=False,
+            reason=reason,
+            policy_id=policy_id,
+            remediation=remediation,
+            layer="validate",
+        )
+        ctx.decision = decision
+        ctx.layer = "validate"
+        raise PolicyDeniedError(decision)
+
     def _layer(ctx: CallContext, nxt: Callable[[], Any]) -> Any:
         if cfg is None:
             return nxt()
 
         if cfg.max_arg_bytes:
-            size = ctx.tool_call.arguments_size_bytes()
+            try:
+                size = measure_arguments(ctx.tool_call.arguments, cfg.max_arg_bytes)
+            except TypeError:
+                _deny(ctx, "Arguments are not JSON-serializable", "Pass only JSON-compatible argument values.")
             if size > cfg.max_arg_bytes:
-                decision = Decision(
-                    allowed=False,
-                    reason=f"Arguments too large (>{cfg.max_arg_bytes} bytes)",
-                    policy_id=policy_id,
-                    remediation="Reduce arguments payload size.",
-                    layer="validate",
-                )
-                ctx.decision = decision
-                ctx.layer = "validate"
-                raise PolicyDeniedError(decision)
+                _deny(ctx, f"Arguments too large (>{cfg.max_arg_bytes} bytes)", "Reduce arguments payload size.")
+            # reused by the authorize layer instead of serializing the arguments again
+            ctx.meta["args_size"] = size
 
         return nxt()
 
@@ -1,10 +1,96 @@
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
+# reported by ToolCall.arguments_size_bytes() for arguments that cannot be serialized
+UNSERIALIZABLE_SIZE = 1_000_000_000
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+    except TypeError:
+        pass  # orjson rejects ints wider than 64 bits and nesting deeper than 255 levels
+    try:
+        return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    except (ValueError, RecursionError) as e:
+        raise TypeError(f"value is not JSON-serializable: {e}") from e
+
+
+def measure_arguments(arguments: dict[str, Any], limit: int = 0) -> int:
+    """
+    Size in bytes of arguments serialized as compact JSON (no spaces after ","
+    or ":"), UTF-8 encoded.
+
+    Items are serialized one at a time so that, given a limit, measuring stops as
+    soon as the running total exceeds it (the result is then only a lower bound).
+    Raises TypeError if the arguments are not JSON-serializable.
+    """
+    if not arguments:
+        return 2  # "{}"
+
+    total = 1  # "{"
+    for k, v in arguments.items():
+        # "key":value followed by "," or the closing "}"
+        total += _json_size(k if type(k) is str else str(k)) + _json_size(v) + 2
+        if limit and total > limit:
+            break
+    return total
+
+
+def _iso_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _iso_timestamp(timestamp: str | None) -> str:
+    return timestamp or _iso_now()
+
+
+def _arguments_size_bytes(arguments: dict[str, Any], limit: int) -> int:
+    try:
+        return measure_arguments(arguments, limit)
+    except TypeError:
+        # if args aren't JSON-serializable, treat as huge and force deny if max_arg_bytes is used
+        return UNSERIALIZABLE_SIZE
+
+
+@dataclass(slots=True)
+class ToolCallCore:
+    """
+    Unvalidated tool call used inside the pipeline.
+
+    Same fields as ToolCall, without pydantic validation; build it directly only
+    from data you already trust (e.g. the enforce_tool_call decorator), and go
+    through ToolCall.parse() for external input.
+    """
+
+    tool_name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+    actor: str | None = None
+    roles: list[str] = field(default_factory=list)
+
+    request_id: str | None = None
+
+    client: dict[str, Any] | None = None
+    context: dict[str, Any] | None = None
+    auth: dict[str, Any] | None = None
+    source: dict[str, Any] | None = None
+
+    timestamp: str | None = None
+
+    def iso_timestamp(self) -> str:
+        return _iso_timestamp(self.timestamp)
+
+    def arguments_size_bytes(self, limit: int = 0) -> int:
+        return _arguments_size_bytes(self.arguments, limit)
+
 
 class ToolCall(BaseModel):
     """
@@ -36,24 +122,41 @@ class ToolCall(BaseModel):
         description="ISO-8601 timestamp for the call; if omitted, caller can set it",
     )
 
+    @classmethod
+    def parse(cls, obj: Any) -> ToolCallCore:
+        """Validate untrusted input (a dict or ToolCall) and return the pipeline representation."""
+        if isinstance(obj, ToolCallCore):
+            return obj
+        call = obj if isinstance(obj, cls) else cls.model_validate(obj)
+        return call.to_core()
+
+    def to_core(self) -> ToolCallCore:
+        return ToolCallCore(
+            tool_name=self.tool_name,
+            arguments=self.arguments,
+            actor=self.actor,
+            roles=self.roles,
+            request_id=self.request_id,
+            client=self.client,
+            context=self.context,
+            auth=self.auth,
+            source=self.source,
+            timestamp=self.timestamp,
+        )
+
     def iso_timestamp(self) -> str:
-        if self.timestamp:
-            return self.timestamp
-        return datetime.now(timezone.utc).isoformat()
+        return _iso_timestamp(self.timestamp)
+
+    def arguments_size_bytes(self, limit: int = 0) -> int:
+        return _arguments_size_bytes(self.arguments, limit)
 
-    def arguments_size_bytes(self) -> int:
-        # simple size estimation without external deps
-        import json
 
-        try:
-            return len(json.dumps(self.arguments, ensure_ascii=False).encode("utf-8"))
-        except Exception:
-            # if args aren't JSON-serializable, treat as huge and force deny if max_arg_bytes is used
-            return 1_000_000_000
+# anything the pipeline and PolicyEngine accept; both only read attributes
+AnyToolCall = ToolCall | ToolCallCore
 
 
 class PolicyDecisionContext(BaseModel):
     """
     Optional container for passing execution metadata into the engine.
     """
-    now_iso: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    now_iso: str = Field(default_factory=_iso_now)
@@ -4,14 +4,14 @@ from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from ..decisions import Decision
-from ..models import ToolCall
+from ..models import ToolCallCore
 
 
 @dataclass(slots=True)
 class CallContext:
-    tool_call: ToolCall
+    tool_call: ToolCallCore
     policy_id: str
-    start_ns: int
+    start_ns: int = 0  # time.monotonic_ns() at pipeline entry; 0 if the pipeline is untimed
 
     decision: Decision | None = None
     tool_result: Any = None
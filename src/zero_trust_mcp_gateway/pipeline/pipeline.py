@@ -3,37 +3,56 @@ from __future__ import annotations
 import time
 from typing import Any, Callable
 
-from ..models import ToolCall
+from ..models import AnyToolCall, ToolCall
 from ..policy.engine import PolicyEngine
 from .context import CallContext, LayerFunc
 
+Chain = Callable[[CallContext, Callable[..., Any]], Any]
+
+
+def _forward(ctx: CallContext, tool_fn: Callable[..., Any]) -> Any:
+    return tool_fn(**(ctx.tool_call.arguments or {}))
+
+
+def _link(layer: LayerFunc, nxt: Chain) -> Chain:
+    def step(ctx: CallContext, tool_fn: Callable[..., Any]) -> Any:
+        return layer(ctx, lambda: nxt(ctx, tool_fn))
+
+    return step
+
+
+def compose(layers: list[LayerFunc]) -> Chain:
+    """
+    Fold layers (outermost first) into a single callable chain ending in the tool call.
+    """
+    chain: Chain = _forward
+    for layer in reversed(layers):
+        chain = _link(layer, chain)
+    return chain
+
 
 class Pipeline:
-    def __init__(self, *, engine: PolicyEngine, layers: list[LayerFunc] | None = None):
+    """
+    timed: record CallContext.start_ns (monotonic) for layers that report latency;
+    when False, start_ns is left at 0 and the clock is not read.
+    """
+
+    def __init__(self, *, engine: PolicyEngine, layers: list[LayerFunc] | None = None, timed: bool = True):
         self.engine = engine
         self.layers = layers or []
+        self.timed = timed
+        # layers are fixed for the pipeline's lifetime, so the chain is built once
+        self._chain = compose(self.layers)
 
-    def execute(self, tool_call: ToolCall, tool_fn: Callable[..., Any]) -> Any:
+    def execute(self, tool_call: AnyToolCall, tool_fn: Callable[..., Any]) -> Any:
+        # layers run on the slotted core; a validated ToolCall is converted once here
         ctx = CallContext(
-            tool_call=tool_call,
+            tool_call=tool_call.to_core() if isinstance(tool_call, ToolCall) else tool_call,
             policy_id=self.engine.policy.policy_id,
-            start_ns=time.perf_counter_ns(),
+            start_ns=time.monotonic_ns() if self.timed else 0,
         )
-
-        def forward() -> Any:
-            return tool_fn(**(tool_call.arguments or {}))
-
-        nxt: Callable[[], Any] = forward
-        for layer in reversed(self.layers):
-            prev = nxt
-
-            def make_next(l: LayerFunc, p: Callable[[], Any]) -> Callable[[], Any]:
-                return lambda: l(ctx, p)
-
-            nxt = make_next(layer, prev)
-
-        return nxt()
+        return self._chain(ctx, tool_fn)
 
     @staticmethod
     def latency_ms(start_ns: int) -> int:
-        return int((time.perf_counter_ns() - start_ns) / 1_000_000)
+        return (time.monotonic_ns() - start_ns) // 1_000_000
@@ -1,12 +1,70 @@
 from __future__ import annotations
 
-import re
-from typing import Any
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, TypeVar
 
 from ..decisions import Decision
-from ..models import ToolCall
+from ..models import AnyToolCall
 from .loader import load_policy_from_dict, load_policy_from_file
-from .schema import AllowRule, Constraint, Policy
+from .schema import AllowRule, Constraint, DenyRule, Policy
+
+DEFAULT_DECISION_CACHE_SIZE = 4096
+
+# calls whose arguments nest deeper or are larger than this (one unit per value plus
+# string lengths) are evaluated without caching, so the LRU never holds big payloads
+CACHE_MAX_DEPTH = 8
+CACHE_MAX_ARGUMENT_SIZE = 512
+
+# a rule with this tool name applies to every tool, after the tool-specific rules
+WILDCARD_TOOL = "*"
+
+RuleT = TypeVar("RuleT", AllowRule, DenyRule)
+
+# distinguishes an absent argument from one explicitly passed as None
+_MISSING = object()
+
+
+def _index_rules(rules: list[RuleT]) -> tuple[dict[str, list[RuleT]], list[RuleT]]:
+    """
+    Bucket rules by tool name, keeping policy order. Wildcard rules are appended to
+    every bucket and also returned on their own as the bucket for unlisted tools.
+    """
+    by_tool: defaultdict[str, list[RuleT]] = defaultdict(list)
+    wildcards: list[RuleT] = []
+    for rule in rules:
+        if rule.tool == WILDCARD_TOOL:
+            wildcards.append(rule)
+        else:
+            by_tool[rule.tool].append(rule)
+    return {tool: bucket + wildcards for tool, bucket in by_tool.items()}, wildcards
+
+
+class _UncacheableError(Exception):
+    pass
+
+
+def _canonicalize(value: Any, depth: int, budget: list[int]) -> Any:
+    """
+    Hashable, type-tagged snapshot of a JSON-like value (so 1, 1.0 and True stay distinct).
+    Raises _UncacheableError for anything else, since arbitrary objects may be mutable, and
+    once the value exceeds CACHE_MAX_DEPTH or the remaining size budget (budget[0]).
+    """
+    t = type(value)
+    budget[0] -= len(value) + 1 if t is str else 1
+    if budget[0] < 0:
+        raise _UncacheableError
+    if value is None or t is str or t is int or t is float or t is bool:
+        return (t, value)
+    # the depth bound also stops cyclic arguments
+    if depth >= CACHE_MAX_DEPTH:
+        raise _UncacheableError
+    depth += 1
+    if t is dict:
+        return (dict, tuple((_canonicalize(k, depth, budget), _canonicalize(v, depth, budget)) for k, v in value.items()))
+    if t is list or t is tuple:
+        return (t, tuple(_canonicalize(v, depth, budget) for v in value))
+    raise _UncacheableError
 
 
 class PolicyEngine:
@@ -15,11 +73,29 @@ class PolicyEngine:
       - deny rules override allow rules
       - allow rules can include constraints and optional roles
       - default is allow/deny if no rules match
+      - rules for tool "*" apply to every tool, after the tool-specific rules
       - optional strict validation can deny unknown args / huge payloads
+
+    Decisions are memoized in an LRU keyed by (tool_name, roles, arguments);
+    pass cache_size=0 to disable. Calls with non-JSON-like, deeply nested or large
+    arguments bypass the cache.
+
+    The rule index and the decision cache are built from the policy once, so
+    `policy` is read-only and must not be mutated; build a new PolicyEngine (and
+    Enforcer) to apply a changed policy.
     """
 
-    def __init__(self, policy: Policy):
-        self.policy = policy
+    def __init__(self, policy: Policy, *, cache_size: int = DEFAULT_DECISION_CACHE_SIZE):
+        self._policy = policy
+        self._allow_by_tool, self._allow_wildcards = _index_rules(policy.allow_rules)
+        self._deny_by_tool, self._deny_wildcards = _index_rules(policy.deny_rules)
+        self._cache_size = cache_size
+        self._decision_cache: OrderedDict[tuple[Any, ...], Decision] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @property
+    def policy(self) -> Policy:
+        return self._policy
 
     @classmethod
     def from_file(cls, path: str) -> "PolicyEngine":
@@ -29,10 +105,44 @@ class PolicyEngine:
     def from_dict(cls, d: dict[str, Any]) -> "PolicyEngine":
         return cls(load_policy_from_dict(d))
 
-    def evaluate(self, tool_call: ToolCall) -> Decision:
+    def evaluate(self, tool_call: AnyToolCall, *, arguments_size: int | None = None) -> Decision:
+        """
+        arguments_size: serialized argument size if the caller already measured it
+        (e.g. the validate layer), so the payload is not serialized a second time.
+        """
+        if not self._cache_size:
+            return self._evaluate(tool_call, arguments_size)
+
+        try:
+            key = (
+                tool_call.tool_name,
+                frozenset(tool_call.roles),
+                _canonicalize(tool_call.arguments, 0, [CACHE_MAX_ARGUMENT_SIZE]),
+            )
+        except (_UncacheableError, TypeError):
+            return self._evaluate(tool_call, arguments_size)
+
+        cache = self._decision_cache
+        with self._cache_lock:
+            decision = cache.get(key)
+            if decision is not None:
+                cache.move_to_end(key)
+                return decision
+
+        decision = self._evaluate(tool_call, arguments_size)
+
+        with self._cache_lock:
+            cache[key] = decision
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return decision
+
+    def _evaluate(self, tool_call: AnyToolCall, arguments_size: int | None = None) -> Decision:
         vcfg = self.policy.validate_cfg
         if vcfg and vcfg.max_arg_bytes:
-            if tool_call.arguments_size_bytes() > vcfg.max_arg_bytes:
+            if arguments_size is None:
+                arguments_size = tool_call.arguments_size_bytes(vcfg.max_arg_bytes)
+            if arguments_size > vcfg.max_arg_bytes:
                 return Decision(
                     allowed=False,
                     reason=f"Arguments too large (>{vcfg.max_arg_bytes} bytes)",
@@ -64,7 +174,7 @@ class PolicyEngine:
                 )
 
             if vcfg and vcfg.reject_unknown_args:
-                unknown = set(tool_call.arguments.keys()) - set(rule.constraints.keys())
+                unknown = tool_call.arguments.keys() - rule.constraints.keys()
                 if unknown:
                     return Decision(
                         allowed=False,
@@ -99,11 +209,8 @@ class PolicyEngine:
             layer="authorize",
         )
 
-    def _match_deny(self, tool_call: ToolCall) -> str | None:
-        for rule in self.policy.deny_rules:
-            if rule.tool != tool_call.tool_name:
-                continue
-
+    def _match_deny(self, tool_call: AnyToolCall) -> str | None:
+        for rule in self._deny_by_tool.get(tool_call.tool_name, self._deny_wildcards):
             if rule.condition is None:
                 return rule.reason
 
@@ -118,14 +225,11 @@ class PolicyEngine:
 
         return None
 
-    def _match_allow(self, tool_call: ToolCall) -> tuple[AllowRule, str | None] | None:
-        for rule in self.policy.allow_rules:
-            if rule.tool != tool_call.tool_name:
-                continue
-
-            if rule.roles is not None:
-                if not set(rule.roles).intersection(set(tool_call.roles)):
-                    return (rule, "Actor role not permitted for this tool")
+    def _match_allow(self, tool_call: AnyToolCall) -> tuple[AllowRule, str | None] | None:
+        for rule in self._allow_by_tool.get(tool_call.tool_name, self._allow_wildcards):
+            roles_set = rule.roles_set()
+            if roles_set is not None and roles_set.isdisjoint(tool_call.roles):
+                return (rule, "Actor role not permitted for this tool")
 
             err = self._validate_constraints(rule.constraints, tool_call.arguments)
             if err is not None:
@@ -136,58 +240,58 @@ class PolicyEngine:
         return None
 
     def _validate_constraints(self, constraints: dict[str, Constraint], args: dict[str, Any]) -> str | None:
-        # required checks first
-        for name, c in constraints.items():
-            if c.required and name not in args:
-                return f"Missing required argument: {name}"
-
+        # single pass: a missing required argument anywhere takes precedence over
+        # type errors, so after the first type error only presence is still checked
+        type_error: str | None = None
         for name, c in constraints.items():
-            if name not in args:
+            value = args.get(name, _MISSING)
+            if value is _MISSING:
+                if c.required:
+                    return f"Missing required argument: {name}"
                 continue
-
-            value = args.get(name)
-
-            # If present but explicitly null, treat as invalid for typed constraints
-            if value is None:
-                return f"Argument '{name}' must not be null"
-
-            if c.type == "string":
-                if not isinstance(value, str):
-                    return f"Argument '{name}' must be a string"
-                if c.pattern:
-                    try:
-                        if not re.match(c.pattern, value):
-                            return f"Argument '{name}' does not match pattern"
-                    except re.error:
-                        return f"Invalid regex pattern in policy for '{name}'"
-                if c.enum is not None and value not in c.enum:
-                    return f"Argument '{name}' must be one of {c.enum}"
-
-            elif c.type == "boolean":
-                if not isinstance(value, bool):
-                    return f"Argument '{name}' must be a boolean"
-
-            elif c.type in ("integer", "number"):
-                if c.type == "integer":
-                    # bool is a subclass of int; reject it
-                    if not isinstance(value, int) or isinstance(value, bool):
-                        return f"Argument '{name}' must be an integer"
-                else:
-                    if not isinstance(value, (int, float)) or isinstance(value, bool):
-                        return f"Argument '{name}' must be a number"
-
-                # safe conversion for min/max comparisons
-                try:
-                    num = float(value)
-                except (TypeError, ValueError):
-                    return f"Argument '{name}' must be numeric"
-
-                if c.min is not None and num < c.min:
-                    return f"Argument '{name}' must be >= {c.min}"
-                if c.max is not None and num > c.max:
-                    return f"Argument '{name}' must be <= {c.max}"
-
-            else:
-                return f"Unsupported constraint type for '{name}': {c.type}"
-
-        return None
+            if type_error is None:
+                type_error = _check_value(name, c, value)
+        return type_error
+
+
+def _check_value(name: str, c: Constraint, value: Any) -> str | None:
+    # If present but explicitly null, treat as invalid for typed constraints
+    if value is None:
+        return f"Argument '{name}' must not be null"
+
+    if c.type == "string":
+        if not isinstance(value, str):
+            return f"Argument '{name}' must be a string"
+        if not c.match(value):
+            return f"Argument '{name}' does not match pattern"
+        if not c.in_enum(value):
+            return f"Argument '{name}' must be one of {c.enum}"
+
+    elif c.type == "boolean":
+        if not isinstance(value, bool):
+            return f"Argument '{name}' must be a boolean"
+
+    elif c.type in ("integer", "number"):
+        if c.type == "integer":
+            # bool is a subclass of int; reject it
+            if not isinstance(value, int) or isinstance(value, bool):
+                return f"Argument '{name}' must be an integer"
+        else:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return f"Argument '{name}' must be a number"
+
+        # safe conversion for min/max comparisons
+        try:
+            num = float(value)
+        except (TypeError, ValueError):
+            return f"Argument '{name}' must be numeric"
+
+        if c.min is not None and num < c.min:
+            return f"Argument '{name}' must be >= {c.min}"
+        if c.max is not None and num > c.max:
+            return f"Argument '{name}' must be <= {c.max}"
+
+    else:
+        return f"Unsupported constraint type for '{name}': {c.type}"
+
+    return None
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
-from .schema import Policy, normalize_policy_dict
+import orjson
+
+from .schema import ConstraintType, Policy, RateLimitScope, normalize_policy_dict
+
+# validated policies kept per (suffix, content hash); an edited file gets a new entry
+POLICY_FILE_CACHE_SIZE = 8
+
+_policy_file_cache: OrderedDict[tuple[str, bytes], Policy] = OrderedDict()
+_policy_file_cache_lock = threading.Lock()
 
 
 def _load_yaml(text: str) -> dict[str, Any]:
@@ -12,28 +23,76 @@ def _load_yaml(text: str) -> dict[str, Any]:
         import yaml  # type: ignore
     except Exception as e:
         raise RuntimeError("PyYAML is required to load .yaml policies. Install pyyaml.") from e
-    data = yaml.safe_load(text) or {}
+    # libyaml's C parser when PyYAML was built with it; same safe subset, much faster
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(text, Loader=loader) or {}
     if not isinstance(data, dict):
         raise ValueError("Policy YAML must parse to a dict/object.")
     return data
 
 
 def _load_json(text: str) -> dict[str, Any]:
-    data = json.loads(text)
+    data = orjson.loads(text)
     if not isinstance(data, dict):
         raise ValueError("Policy JSON must parse to a dict/object.")
     return data
 
 
+def _intern_policy(policy: Policy) -> Policy:
+    """
+    Intern the strings the engine compares and looks up on every call (tool names,
+    constraint keys and types, deny reasons and conditions, rate-limit scope), so
+    equality checks against them mostly reduce to identity checks.
+    """
+    intern = sys.intern
+    for rule in policy.allow_rules:
+        rule.tool = intern(rule.tool)
+        for c in rule.constraints.values():
+            c.type = cast(ConstraintType, intern(c.type))
+        rule.constraints = {intern(k): c for k, c in rule.constraints.items()}
+    for deny in policy.deny_rules:
+        deny.tool = intern(deny.tool)
+        deny.reason = intern(deny.reason)
+        if deny.condition:
+            deny.condition = {intern(k): v for k, v in deny.condition.items()}
+    if policy.rate_limit is not None:
+        policy.rate_limit.scope = cast(RateLimitScope, intern(policy.rate_limit.scope))
+    return policy
+
+
 def load_policy_from_file(path: str) -> Policy:
+    """
+    Load and validate a policy file. Parsing and validation are cached by file
+    content, so reloading an unchanged file is cheap; every call returns its own
+    copy of the Policy, so mutating one never affects another.
+    """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(path)
 
-    raw = p.read_text(encoding="utf-8")
-    if p.suffix.lower() in [".yaml", ".yml"]:
+    raw = p.read_bytes()
+    suffix = p.suffix.lower()
+    key = (suffix, hashlib.sha256(raw).digest())
+
+    with _policy_file_cache_lock:
+        policy = _policy_file_cache.get(key)
+        if policy is not None:
+            _policy_file_cache.move_to_end(key)
+
+    if policy is None:
+        policy = _parse_policy_file(suffix, raw.decode("utf-8"))
+        with _policy_file_cache_lock:
+            _policy_file_cache[key] = policy
+            if len(_policy_file_cache) > POLICY_FILE_CACHE_SIZE:
+                _policy_file_cache.popitem(last=False)
+
+    return policy.model_copy(deep=True)
+
+
+def _parse_policy_file(suffix: str, raw: str) -> Policy:
+    if suffix in [".yaml", ".yml"]:
         d = _load_yaml(raw)
-    elif p.suffix.lower() == ".json":
+    elif suffix == ".json":
         d = _load_json(raw)
     else:
         try:
@@ -42,12 +101,12 @@ def load_policy_from_file(path: str) -> Policy:
             d = _load_json(raw)
 
     d = normalize_policy_dict(d)
-    return Policy.model_validate(d)
+    return _intern_policy(Policy.model_validate(d))
 
 
 def load_policy_from_dict(d: dict[str, Any]) -> Policy:
     d = normalize_policy_dict(d)
-    return Policy.model_validate(d)
+    return _intern_policy(Policy.model_validate(d))
 
 
 class PolicyLoader:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+import re
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 ConstraintType = Literal["string", "integer", "number", "boolean"]
+RateLimitScope = Literal["actor", "session", "tool", "actor+tool"]
 
 
 class Constraint(BaseModel):
@@ -22,6 +24,68 @@ class Constraint(BaseModel):
 
     required: bool | None = None
 
+    # Derived once per policy load. Stored in the instance __dict__ (not as pydantic
+    # private attrs, whose lookup goes through __getattr__) so hot-path reads stay cheap.
+    # Each is kept with the field value it was derived from and rebuilt when that no
+    # longer matches (reassigned fields, model_copy(update=...), model_construct()).
+    # The enum list is checked by identity, so membership stays O(1) for large enums;
+    # replace the list rather than mutating it in place.
+    _compiled: ClassVar[tuple[str | None, re.Pattern[str] | None]] = (None, None)
+    _enum_set: ClassVar[tuple[list[Any] | None, frozenset[Any] | None]] = (None, None)
+
+    @model_validator(mode="after")
+    def _derive(self) -> Constraint:
+        # compile the pattern at load time, so an invalid one fails policy loading
+        if self.pattern:
+            try:
+                self._compile_pattern()
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern {self.pattern!r}: {e}") from e
+        if self.enum is not None:
+            self._derive_enum_set()
+        return self
+
+    def _compile_pattern(self) -> re.Pattern[str]:
+        pattern = self.pattern or ""
+        compiled = re.compile(pattern)
+        object.__setattr__(self, "_compiled", (pattern, compiled))
+        return compiled
+
+    def _derive_enum_set(self) -> frozenset[Any] | None:
+        enum = self.enum
+        try:
+            enum_set = frozenset(enum or ())
+        except TypeError:
+            enum_set = None  # unhashable enum members: fall back to list membership
+        object.__setattr__(self, "_enum_set", (enum, enum_set))
+        return enum_set
+
+    def match(self, value: str) -> bool:
+        """
+        Whether value satisfies pattern (anchored at the start, like re.match); True
+        without one. Fails closed: a pattern that does not compile matches nothing.
+        """
+        pattern = self.pattern
+        if not pattern:
+            return True
+        source, compiled = self._compiled
+        if compiled is None or source != pattern:
+            try:
+                compiled = self._compile_pattern()
+            except re.error:
+                return False
+        return compiled.match(value) is not None
+
+    def in_enum(self, value: Any) -> bool:
+        """Whether value is one of enum; True without one."""
+        enum = self.enum
+        if enum is None:
+            return True
+        source, enum_set = self._enum_set
+        if source is not enum:
+            enum_set = self._derive_enum_set()
+        return value in (enum if enum_set is None else enum_set)
+
 
 class AllowRule(BaseModel):
     tool: str
@@ -30,6 +94,26 @@ class AllowRule(BaseModel):
     # optional RBAC
     roles: list[str] | None = None
 
+    # derived once per policy load and kept with the roles list it came from,
+    # like the Constraint caches (see there for why this is not a PrivateAttr)
+    _roles_set: ClassVar[tuple[list[str] | None, frozenset[str] | None]] = (None, None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._derive_roles_set()
+
+    def _derive_roles_set(self) -> frozenset[str] | None:
+        roles = self.roles
+        roles_set = frozenset(roles) if roles is not None else None
+        object.__setattr__(self, "_roles_set", (roles, roles_set))
+        return roles_set
+
+    def roles_set(self) -> frozenset[str] | None:
+        """Roles permitted by this rule as a set, or None when any role is allowed."""
+        source, roles_set = self._roles_set
+        if source is not self.roles:
+            roles_set = self._derive_roles_set()
+        return roles_set
+
 
 class DenyRule(BaseModel):
     tool: str
@@ -46,7 +130,7 @@ class RateLimitConfig(BaseModel):
     enabled: bool = False
     limit_per_minute: int = 0
     burst: int = 0
-    scope: Literal["actor", "session", "tool", "actor+tool"] = "actor"
+    scope: RateLimitScope = "actor"
 
 
 class DetectAttacksConfig(BaseModel):
@@ -1,47 +1,100 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Protocol
+
+# module-level alias so tests can swap the clock without patching time itself
+_monotonic_ns = time.monotonic_ns
+
+_NS_PER_MINUTE = 60_000_000_000
+
+DEFAULT_MAX_KEYS = 100_000
+
+
+class RateLimiter(Protocol):
+    """
+    Backend interface used by the rate-limit layer.
+
+    InMemoryRateLimiter counts per process. For gateways running several worker
+    processes, pass an implementation backed by shared state (e.g. Redis) to
+    Enforcer(rate_limiter=...) so limits apply across workers.
+    """
+
+    def allow(self, key: str, limit_per_minute: int, burst: int) -> tuple[bool, dict[str, int]]:
+        ...
 
 
 @dataclass(slots=True)
 class TokenBucket:
+    """
+    Token bucket kept in integer nanoseconds: one token is worth refill_ns_per_token
+    ns of accumulated time, so refilling is a plain add of the monotonic clock delta.
+    """
+
     capacity: int
-    refill_per_sec: float
-    tokens: float
-    last_ts: float
+    refill_ns_per_token: int
+    tokens_ns: int
+    last_ns: int
+    capacity_ns: int = field(init=False, repr=False)
 
-    def take(self, n: int = 1) -> tuple[bool, int]:
-        now = time.time()
-        elapsed = max(0.0, now - self.last_ts)
-        self.last_ts = now
+    def __post_init__(self) -> None:
+        self.capacity_ns = self.capacity * self.refill_ns_per_token
 
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_sec)
+    @classmethod
+    def full(cls, capacity: int, limit_per_minute: int) -> TokenBucket:
+        # refill at limit_per_minute, but never slower than one token per 10s (6/min)
+        refill_ns_per_token = _NS_PER_MINUTE // max(6, limit_per_minute)
+        return cls(
+            capacity=capacity,
+            refill_ns_per_token=refill_ns_per_token,
+            tokens_ns=capacity * refill_ns_per_token,
+            last_ns=_monotonic_ns(),
+        )
 
-        if self.tokens >= n:
-            self.tokens -= n
-            return True, int(self.tokens)
+    def take(self, n: int = 1) -> tuple[bool, int]:
+        now = _monotonic_ns()
+        tokens_ns = self.tokens_ns + (now - self.last_ns)
+        if tokens_ns > self.capacity_ns:
+            tokens_ns = self.capacity_ns
+        self.last_ns = now
 
-        return False, int(self.tokens)
+        per_token = self.refill_ns_per_token
+        cost = n * per_token
+        ok = tokens_ns >= cost
+        if ok:
+            tokens_ns -= cost
+        self.tokens_ns = tokens_ns
+        return ok, tokens_ns // per_token
 
 
 class InMemoryRateLimiter:
     """
     Lightweight in-memory limiter. Good for single-process dev/demo.
+
+    At most max_keys buckets are kept; when a new key arrives beyond that, the
+    least recently used bucket is evicted (that key starts over with a full bucket).
     """
 
-    def __init__(self) -> None:
-        self._buckets: dict[str, TokenBucket] = {}
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
 
     def allow(self, key: str, limit_per_minute: int, burst: int) -> tuple[bool, dict[str, int]]:
-        cap = max(1, burst if burst else limit_per_minute)
-        refill_per_sec = max(0.1, limit_per_minute / 60.0)
-
-        b = self._buckets.get(key)
+        buckets = self._buckets
+        b = buckets.get(key)
         if b is None:
-            b = TokenBucket(capacity=cap, refill_per_sec=refill_per_sec, tokens=float(cap), last_ts=time.time())
-            self._buckets[key] = b
+            # bucket parameters are only needed when a key is first seen
+            b = TokenBucket.full(max(1, burst if burst else limit_per_minute), limit_per_minute)
+            buckets[key] = b
+            if len(buckets) > self.max_keys:
+                buckets.popitem(last=False)
+        else:
+            try:
+                buckets.move_to_end(key)
+            except KeyError:
+                pass  # evicted by a concurrent insert; b is still ours for this call
 
         ok, remaining = b.take(1)
-        meta = {"limit": limit_per_minute, "burst": burst or cap, "remaining": max(0, remaining)}
-        return ok, meta
+        return ok, {"limit": limit_per_minute, "burst": burst or b.capacity, "remaining": remaining}
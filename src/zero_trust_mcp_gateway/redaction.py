@@ -1,77 +1,373 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections.abc import Callable, Iterable, Sized
+from functools import lru_cache
 from typing import Any
 
+try:
+    # optional: pip install zero-trust-mcp-gateway[hyperscan]
+    import hyperscan  # type: ignore[import-not-found]
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
 DEFAULT_DENY_KEYS = ["password", "token", "secret", "api_key", "authorization"]
 
+# leaf types that never carry PII or attack strings; matched by exact type, never scanned
+SCALAR_TYPES = frozenset({type(None), bool, int, float})
+
 EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
 PHONE_RE = re.compile(r"\b(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}\b")
 
+# emails and phones in one scan; overlapping matches resolve leftmost-first
+_RE_EMAIL_PHONE = re.compile(rf"(?P<email>{EMAIL_RE.pattern})|(?P<phone>{PHONE_RE.pattern})", re.IGNORECASE)
+
+_PII_REPLACEMENTS = {"email": "[REDACTED_EMAIL]", "phone": "[REDACTED_PHONE]"}
+
+
+def _pii_replacement(m: re.Match[str]) -> str:
+    return _PII_REPLACEMENTS[m.lastgroup]  # type: ignore[index]
+
+
+# cheap necessary conditions checked before running a regex: an email contains "@",
+# and a phone number has at least 10 digits (so at least 10 characters)
+_PHONE_MIN_LEN = 10
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _may_have_phone(s: str) -> bool:
+    return len(s) >= _PHONE_MIN_LEN and _DIGIT_RE.search(s) is not None
+
+
+def _may_have_email(s: str) -> bool:
+    return "@" in s
+
+
+def _may_have_email_or_phone(s: str) -> bool:
+    return "@" in s or _may_have_phone(s)
+
+
+# (pii_emails, pii_phones) -> necessary condition for the matching scrubber to change s
+_PII_GUARDS: dict[tuple[bool, bool], Callable[[str], bool]] = {
+    (True, True): _may_have_email_or_phone,
+    (True, False): _may_have_email,
+    (False, True): _may_have_phone,
+}
+
+
+def _scrub_emails(s: str) -> str:
+    return EMAIL_RE.sub("[REDACTED_EMAIL]", s) if "@" in s else s
+
+
+def _scrub_phones(s: str) -> str:
+    return PHONE_RE.sub("[REDACTED_PHONE]", s) if _may_have_phone(s) else s
+
+
+def _scrub_emails_phones(s: str) -> str:
+    # fall back to the single-kind pattern when the other kind cannot occur
+    if "@" not in s:
+        return _scrub_phones(s)
+    if not _may_have_phone(s):
+        return EMAIL_RE.sub("[REDACTED_EMAIL]", s)
+    return _RE_EMAIL_PHONE.sub(_pii_replacement, s)
+
+
+# strings shorter than this skip the Hyperscan prefilter; re is cheaper on them
+HYPERSCAN_MIN_LEN = 64
+
+
+def _hs_expression(rx: re.Pattern[str]) -> bytes:
+    # for ASCII text the patterns mean the same to both engines, except that
+    # Python's \s also matches \x1c-\x1f (it only appears inside classes here)
+    return rx.pattern.replace(r"\s]", r"\s\x1c-\x1f]").encode("ascii")
+
+
+def _hs_stop(id: int, start: int, end: int, flags: int, context: Any) -> bool:
+    return True  # any match answers the question; terminate the scan
+
+
+class _HyperscanPrefilter:
+    """
+    Cheap "could this contain PII?" test on long ASCII strings.
+
+    Hyperscan only rules strings out; anything it may match is still scrubbed
+    by the re patterns, so redaction output does not depend on it being installed.
+    """
+
+    def __init__(self, regexes: list[re.Pattern[str]]):
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[_hs_expression(rx) for rx in regexes],
+            ids=list(range(len(regexes))),
+            flags=[
+                hyperscan.HS_FLAG_SINGLEMATCH | (hyperscan.HS_FLAG_CASELESS if rx.flags & re.IGNORECASE else 0)
+                for rx in regexes
+            ],
+        )
+        self._local = threading.local()  # scratch space is per thread
+
+    def may_match(self, s: str) -> bool:
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+        try:
+            self._db.scan(s.encode("ascii"), match_event_handler=_hs_stop, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+
+def _prefiltered(scrub: Callable[[str], str], prefilter: _HyperscanPrefilter) -> Callable[[str], str]:
+    def _scrub(s: str) -> str:
+        if len(s) >= HYPERSCAN_MIN_LEN:
+            # the truncation marker can never be part of a match
+            head = s[:-1] if s[-1] == "…" else s
+            if head.isascii() and not prefilter.may_match(head):
+                return s
+        return scrub(s)
+
+    return _scrub
+
+
+def _build_scrubbers() -> dict[tuple[bool, bool], Callable[[str], str] | None]:
+    """(pii_emails, pii_phones) -> single-pass scrubber, or None when there is nothing to scrub."""
+    scrubbers: dict[tuple[bool, bool], Callable[[str], str] | None] = {
+        (True, True): _scrub_emails_phones,
+        (True, False): _scrub_emails,
+        (False, True): _scrub_phones,
+        (False, False): None,
+    }
+    if hyperscan is None:
+        return scrubbers
+
+    patterns = {(True, True): [EMAIL_RE, PHONE_RE], (True, False): [EMAIL_RE], (False, True): [PHONE_RE]}
+    try:
+        for flags, regexes in patterns.items():
+            scrubbers[flags] = _prefiltered(scrubbers[flags], _HyperscanPrefilter(regexes))  # type: ignore[arg-type]
+    except hyperscan.error:
+        pass  # unsupported build/platform: keep the plain re scrubbers for the rest
+    return scrubbers
+
+
+_SCRUBBERS = _build_scrubbers()
+
+# nesting deeper than this is treated as a cycle (the recursive walker hit RecursionError here)
+MAX_DEPTH = 1000
+
 
-def _should_redact_key(key: str, deny_keys: list[str]) -> bool:
-    k = key.lower()
-    return any(k == dk.lower() for dk in deny_keys)
+def deny_key_set(deny_keys: Iterable[str]) -> frozenset[str]:
+    """Lowercased deny keys for O(1) case-insensitive lookups."""
+    return frozenset(dk.lower() for dk in deny_keys)
+
+
+@lru_cache(maxsize=64)
+def _cached_deny_key_set(deny_keys: tuple[str, ...]) -> frozenset[str]:
+    # redact_value() callers usually pass the same few deny lists over and over
+    return deny_key_set(deny_keys)
+
+
+_DEFAULT_DENY_SET = deny_key_set(DEFAULT_DENY_KEYS)
+
+
+# joins pending strings for one regex pass; matched by no part of the PII patterns
+# (unlike e.g. \x1e, which \s matches) and not a word character, so matches never
+# cross it and \b behaves at item edges as it does at string ends
+_BATCH_SEP = "\x00"
+
+
+def _scrub_slots(slots: list[tuple[Any, Any]], scrub: Callable[[str], str]) -> None:
+    """Scrub the strings stored at container[key] for each slot, in one scrub() call when possible."""
+    if len(slots) > 1:
+        joined = _BATCH_SEP.join([c[k] for c, k in slots])
+        if joined.count(_BATCH_SEP) == len(slots) - 1:
+            for (c, k), s in zip(slots, scrub(joined).split(_BATCH_SEP)):
+                c[k] = s
+            return
+        # some string contains the separator itself; scrub them one by one
+    for c, k in slots:
+        c[k] = scrub(c[k])
+
+
+# node kinds the walker dispatches on
+_SCALAR, _STR, _DICT, _LIST, _TUPLE, _OTHER = range(6)
+
+# exact type -> kind: one dict lookup per node instead of a chain of type checks
+_KINDS: dict[type, int] = {
+    **dict.fromkeys(SCALAR_TYPES, _SCALAR),
+    str: _STR,
+    dict: _DICT,
+    list: _LIST,
+    tuple: _TUPLE,
+}
+
+
+def _kind_of(v: Any) -> int:
+    """Kind for values whose exact type is not in _KINDS: subclasses get their builtin base's."""
+    for base in (str, int, float, dict, list, tuple):
+        if isinstance(v, base):
+            return _KINDS[base]
+    return _OTHER
+
+
+def _last_wins(d: dict[Any, Any], deny: frozenset[str]) -> list[tuple[Any, Any]]:
+    """Entries of d keeping, per output key, the first position and the last value."""
+    last: dict[str, tuple[Any, Any]] = {}
+    for k, item in d.items():
+        last[k if isinstance(k, str) and k.lower() in deny else str(k)] = (k, item)
+    return list(last.values())
+
+
+Redactor = Callable[[Any], Any]
+
+
+def make_redactor(
+    *,
+    deny_keys: Iterable[str] | None = None,
+    pii_emails: bool = True,
+    pii_phones: bool = False,
+    max_string_len: int = 2048,
+) -> Redactor:
+    """
+    Build a redact(value) function with the configuration resolved once: the
+    lowercased deny-key set and the PII scrubber are bound into the closure, so
+    callers that redact repeatedly with the same settings only pay for the walk.
+    """
+    deny = _cached_deny_key_set(tuple(deny_keys)) if deny_keys else _DEFAULT_DENY_SET
+    scrub = _SCRUBBERS[bool(pii_emails), bool(pii_phones)]
+    guard = _PII_GUARDS.get((bool(pii_emails), bool(pii_phones)))
+
+    def redact(value: Any) -> Any:
+        root: list[Any] = [None]
+        tuples: list[tuple[Any, Any]] = []
+        # strings are truncated in place during the walk; those that may contain PII
+        # are remembered and scrubbed together in one pass at the end
+        pending: list[tuple[Any, Any]] = []
+        # only containers and unknown objects go through the stack; scalar items are
+        # written straight into their container's copy while it is being built
+        stack: list[tuple[Any, Any, Any, int]] = [(root, 0, value, 0)]
+        pop = stack.pop
+        push = stack.append
+        kind_of = _KINDS.get
+
+        def put_str(container: Any, key: Any, s: str) -> None:
+            if max_string_len and len(s) > max_string_len:
+                s = s[:max_string_len] + "…"
+            container[key] = s
+            if guard is not None and guard(s):
+                pending.append((container, key))
+
+        while stack:
+            parent, key, v, depth = pop()
+
+            kind = kind_of(type(v))
+            if kind is None:
+                kind = _kind_of(v)
+
+            if kind == _STR:
+                put_str(parent, key, v)
+
+            elif kind == _SCALAR:
+                parent[key] = v
+
+            elif kind != _OTHER:
+                if depth >= MAX_DEPTH:
+                    raise RecursionError("maximum nesting depth exceeded while redacting")
+
+                child_depth = depth + 1
+                if kind == _DICT:
+                    pairs: Iterable[tuple[Any, Any]] = v.items()
+                    deduped = False
+                    while True:
+                        out: Any = {}
+                        stack_mark, pending_mark = len(stack), len(pending)
+                        mixed_keys = False
+                        for k, item in pairs:
+                            if isinstance(k, str) and k.lower() in deny:
+                                out[k] = "[REDACTED]"
+                                continue
+                            if type(k) is str:
+                                sk = k
+                            else:
+                                mixed_keys = True
+                                sk = str(k)
+                            item_kind = kind_of(type(item))
+                            if item_kind == _STR:
+                                put_str(out, sk, item)
+                            elif item_kind == _SCALAR:
+                                out[sk] = item
+                            else:
+                                out[sk] = None  # placeholder keeps key order
+                                push((out, sk, item, child_depth))
+                        if not mixed_keys or deduped or len(out) == len(v):
+                            break
+                        # distinct keys stringified to the same key (e.g. 1 and "1"); the
+                        # deferred writes above could let an earlier value win, so undo
+                        # them and redo with only the last value per output key
+                        del stack[stack_mark:]
+                        del pending[pending_mark:]
+                        pairs = _last_wins(v, deny)
+                        deduped = True
+                else:
+                    out = [None] * len(v)
+                    for i, item in enumerate(v):
+                        item_kind = kind_of(type(item))
+                        if item_kind == _STR:
+                            put_str(out, i, item)
+                        elif item_kind == _SCALAR:
+                            out[i] = item
+                        else:
+                            push((out, i, item, child_depth))
+                    if kind == _TUPLE:
+                        tuples.append((parent, key))
+
+                parent[key] = out
+
+            elif isinstance(v, Sized | Iterable):
+                # unknown containers (sets, bytes, mappings, ...) are never stringified:
+                # their str() can be as large as the payload and carry secrets verbatim
+                parent[key] = "[REDACTED]"
+
+            else:
+                # fallback for other unknown objects
+                try:
+                    text = str(v)
+                except Exception:
+                    parent[key] = "[REDACTED]"
+                else:
+                    put_str(parent, key, text)
+
+        if pending:
+            _scrub_slots(pending, scrub)  # type: ignore[arg-type]
+
+        # tuples were built as lists; convert innermost first (reverse discovery order)
+        for parent, key in reversed(tuples):
+            parent[key] = tuple(parent[key])
+
+        return root[0]
+
+    return redact
 
 
 def redact_value(
     value: Any,
     *,
-    deny_keys: list[str] | None = None,
+    deny_keys: Iterable[str] | None = None,
     pii_emails: bool = True,
     pii_phones: bool = False,
     max_string_len: int = 2048,
 ) -> Any:
-    deny_keys = deny_keys or DEFAULT_DENY_KEYS
-
-    if value is None:
-        return None
-
-    if isinstance(value, str):
-        s = value
-        if max_string_len and len(s) > max_string_len:
-            s = s[:max_string_len] + "…"
-        if pii_emails:
-            s = EMAIL_RE.sub("[REDACTED_EMAIL]", s)
-        if pii_phones:
-            s = PHONE_RE.sub("[REDACTED_PHONE]", s)
-        return s
-
-    if isinstance(value, (int, float, bool)):
-        return value
-
-    if isinstance(value, list):
-        return [redact_value(v, deny_keys=deny_keys, pii_emails=pii_emails, pii_phones=pii_phones, max_string_len=max_string_len) for v in value]
-
-    if isinstance(value, tuple):
-        return tuple(
-            redact_value(v, deny_keys=deny_keys, pii_emails=pii_emails, pii_phones=pii_phones, max_string_len=max_string_len)
-            for v in value
-        )
+    """
+    Return a redacted copy of value: dict entries under deny_keys (case-insensitive)
+    become "[REDACTED]", strings are truncated and scrubbed of emails/phones, and
+    unknown containers become "[REDACTED]" while other unknown objects are
+    stringified. Walks the structure with an explicit stack.
 
-    if isinstance(value, dict):
-        out: dict[str, Any] = {}
-        for k, v in value.items():
-            if isinstance(k, str) and _should_redact_key(k, deny_keys):
-                out[k] = "[REDACTED]"
-            else:
-                out[str(k)] = redact_value(
-                    v,
-                    deny_keys=deny_keys,
-                    pii_emails=pii_emails,
-                    pii_phones=pii_phones,
-                    max_string_len=max_string_len,
-                )
-        return out
-
-    # fallback for unknown objects
-    try:
-        return redact_value(
-            str(value),
-            deny_keys=deny_keys,
-            pii_emails=pii_emails,
-            pii_phones=pii_phones,
-            max_string_len=max_string_len,
-        )
-    except Exception:
-        return "[REDACTED]"
+    For repeated calls with the same settings, build a redactor once with make_redactor().
+    """
+    return make_redactor(
+        deny_keys=deny_keys,
+        pii_emails=pii_emails,
+        pii_phones=pii_phones,
+        max_string_len=max_string_len,
+    )(value)
@@ -0,0 +1,151 @@
+"""
+Unit tests for the structured audit logger.
+"""
+
+import io
+import json
+import logging
+import os
+import signal
+
+import pytest
+
+from zero_trust_mcp.audit.logger import AuditLogger, AuditSink, _dumps, _Flusher, get_audit_logger
+from zero_trust_mcp.redaction import DEFAULT_DENY_KEYS, deny_key_set
+
+
+def _log(audit: AuditLogger, tool_name: str) -> None:
+    audit.log(
+        action="tool_call",
+        tool_name=tool_name,
+        decision="allow",
+        reason="Matched allow rule",
+        policy_id="test_policy",
+        arguments={"query": "x"},
+    )
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestAuditLogger:
+    """Test audit event emission."""
+
+    def test_batched_events_written_to_sink(self):
+        """Queued events are all written to the sink once flush() returns."""
+        buf = io.BytesIO()
+        logger = logging.getLogger("zero_trust_mcp.audit.test_sink")
+        flusher = _Flusher(logger, sink=AuditSink(buf))
+        flusher.start()
+        audit = AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS), flusher=flusher)
+
+        for i in range(5):
+            _log(audit, f"tool_{i}")
+        audit.flush()
+
+        events = [json.loads(line) for line in buf.getvalue().splitlines()]
+        assert [e["tool_name"] for e in events] == [f"tool_{i}" for i in range(5)]
+        assert events[0]["arguments_summary"] == {"keys": ["query"], "key_count": 1}
+        assert events[0]["timestamp"].endswith("Z")
+
+    def test_wide_int_does_not_drop_batch(self):
+        """An event orjson cannot encode is still written, without losing the rest of its batch."""
+        buf = io.BytesIO()
+        logger = logging.getLogger("zero_trust_mcp.audit.test_wide_int")
+        flusher = _Flusher(logger, sink=AuditSink(buf))
+        audit = AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS), flusher=flusher)
+
+        _log(audit, "before")
+        audit.log(
+            action="tool_call",
+            tool_name="wide",
+            decision="allow",
+            reason="Matched allow rule",
+            policy_id="test_policy",
+            result={"n": 2**64},
+            include_result=True,
+        )
+        _log(audit, "after")
+        flusher.start()  # started after queueing so all three events land in one batch
+        audit.flush()
+
+        events = [json.loads(line) for line in buf.getvalue().splitlines()]
+        assert [e["tool_name"] for e in events] == ["before", "wide", "after"]
+        assert events[1]["result"] == {"n": 2**64}
+
+    def test_unserializable_event_keeps_envelope(self):
+        """An event no encoder can handle is written as its envelope fields with an error marker."""
+        cyclic: list = []
+        cyclic.append(cyclic)
+        event = {"timestamp": 0, "action": "tool_call", "tool_name": "t", "decision": "allow", "result": cyclic}
+
+        out = json.loads(_dumps(event))
+        assert out["tool_name"] == "t"
+        assert out["error"] == "audit event not serializable"
+        assert "result" not in out
+
+    def test_existing_handlers_receive_events(self):
+        """Handlers configured before get_audit_logger() receive batched events."""
+        handler = _ListHandler()
+        logging.getLogger("zero_trust_mcp.audit.test_handlers").addHandler(handler)
+        audit = get_audit_logger("zero_trust_mcp.audit.test_handlers")
+
+        _log(audit, "search")
+        _log(audit, "get_user")
+        audit.flush()
+
+        lines = [line for m in handler.messages for line in m.splitlines()]
+        assert [json.loads(line)["tool_name"] for line in lines] == ["search", "get_user"]
+
+    def test_sync_logger_without_flusher(self, caplog):
+        """An AuditLogger without a flusher writes synchronously."""
+        logger = logging.getLogger("zero_trust_mcp.audit.test_sync")
+        audit = AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS))
+        with caplog.at_level(logging.INFO, logger="zero_trust_mcp.audit.test_sync"):
+            _log(audit, "search")
+
+        assert json.loads(caplog.records[-1].getMessage())["tool_name"] == "search"
+
+    def test_drop_overflow_counts_dropped_events(self):
+        """With overflow='drop', events beyond the queue size are discarded."""
+        logger = logging.getLogger("zero_trust_mcp.audit.test_drop")
+        flusher = _Flusher(logger, maxsize=1)  # not started: nothing drains the queue
+        audit = AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS), overflow="drop", flusher=flusher)
+
+        _log(audit, "a")
+        _log(audit, "b")
+
+        assert flusher.dropped == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_gets_a_working_flusher(self, tmp_path):
+        """A flusher started before fork() keeps writing in the child instead of hanging."""
+        path = tmp_path / "audit.jsonl"
+        logger = logging.getLogger("zero_trust_mcp.audit.test_fork")
+        with open(path, "ab", buffering=0) as stream:
+            flusher = _Flusher(logger, maxsize=1, sink=AuditSink(stream))
+            flusher.start()
+            audit = AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS), flusher=flusher)
+            _log(audit, "parent")
+            audit.flush()
+
+            pid = os.fork()
+            if pid == 0:  # child: a dead writer would hang on the full queue
+                signal.alarm(5)
+                try:
+                    for i in range(3):
+                        _log(audit, f"child_{i}")
+                    audit.flush()
+                finally:
+                    os._exit(0)
+            _, status = os.waitpid(pid, 0)
+
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        lines = path.read_bytes().splitlines()
+        assert [json.loads(line)["tool_name"] for line in lines] == ["parent", "child_0", "child_1", "child_2"]
@@ -0,0 +1,87 @@
+"""
+Unit tests for the attack-detection layer.
+"""
+
+import pytest
+
+from zero_trust_mcp.decisions import PolicyDeniedError
+from zero_trust_mcp.layers.detect_attacks import detect_attacks_layer
+from zero_trust_mcp.models import ToolCallCore
+from zero_trust_mcp.pipeline.context import CallContext
+from zero_trust_mcp.policy.schema import DetectAttacksConfig
+
+
+def _run(arguments, cfg=None):
+    """Run the layer on arguments; returns "ok" if the call was passed on."""
+    cfg = cfg or DetectAttacksConfig(enabled=True)
+    ctx = CallContext(tool_call=ToolCallCore(tool_name="search", arguments=arguments), policy_id="p")
+    return detect_attacks_layer("p", cfg)(ctx, lambda: "ok")
+
+
+class TestDetectAttacks:
+    """Test detection of injection/abuse patterns in arguments."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "1; SELECT * FROM users",
+            "a UNION b",
+            "insert into t",
+            "Update t",
+            "delete from t",
+            "drop table t",
+            "alter table t",
+            "http://169.254.169.254/latest/meta-data",
+            "http://localhost:8080",
+            "http://127.0.0.1/admin",
+            "../../etc/passwd",
+            "..\\windows\\system32",
+        ],
+    )
+    def test_each_pattern_denied(self, value):
+        """Test that every SQLi, SSRF and traversal pattern is denied."""
+        with pytest.raises(PolicyDeniedError) as exc:
+            _run({"query": value})
+        assert exc.value.decision.layer == "detect_attacks"
+
+    def test_clean_and_word_fragments_allowed(self):
+        """Test that keywords only match as whole words."""
+        assert _run({"query": "selection of updates", "path": "docs/readme.md", "url": "https://example.com"}) == "ok"
+
+    def test_only_fields_of_interest_scanned(self):
+        """Test that strings under other keys are ignored."""
+        assert _run({"comment": "DROP TABLE users"}) == "ok"
+
+    def test_nested_arguments_scanned(self):
+        """Test that fields of interest are found at any depth, through dicts and lists."""
+        with pytest.raises(PolicyDeniedError):
+            _run({"filters": [{"ok": 1}, {"inner": {"where": "1=1 UNION select"}}]})
+
+    def test_cyclic_arguments_terminate(self):
+        """Test that self-referencing arguments are walked once instead of looping forever."""
+        args: dict = {"query": "hello", "items": []}
+        args["self"] = args
+        args["items"].append(args["items"])
+        assert _run(args) == "ok"
+
+        args["items"].append({"sql": "drop table t"})
+        with pytest.raises(PolicyDeniedError):
+            _run(args)
+
+    def test_non_str_scalars_ignored(self):
+        """Test that numbers, booleans and None under fields of interest are not scanned."""
+        assert _run({"query": 1, "sql": 2.5, "where": True, "url": None, "path": [1, None, False]}) == "ok"
+
+    def test_str_subclass_scanned(self):
+        """Test that str subclasses cannot slip past detection."""
+
+        class Text(str):
+            pass
+
+        with pytest.raises(PolicyDeniedError):
+            _run({"query": Text("DROP TABLE t")})
+
+    def test_disabled_or_allow_mode_passes(self):
+        """Test that a disabled layer or on_detect='allow' passes suspicious calls on."""
+        assert _run({"query": "DROP TABLE t"}, DetectAttacksConfig(enabled=False)) == "ok"
+        assert _run({"query": "DROP TABLE t"}, DetectAttacksConfig(enabled=True, on_detect="allow")) == "ok"
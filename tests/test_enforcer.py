@@ -0,0 +1,77 @@
+"""
+Unit tests for the Enforcer pipeline.
+"""
+
+import json
+import logging
+import time
+
+from zero_trust_mcp import Enforcer, PolicyEngine, ToolCall
+from zero_trust_mcp.audit.logger import AuditLogger
+from zero_trust_mcp.layers.authorize import authorize_layer
+from zero_trust_mcp.layers.detect_attacks import detect_attacks_layer
+from zero_trust_mcp.layers.rate_limit import rate_limit_layer
+from zero_trust_mcp.layers.redact import redact_layer
+from zero_trust_mcp.layers.validate import validate_layer
+from zero_trust_mcp.pipeline.pipeline import Pipeline
+from zero_trust_mcp.redaction import DEFAULT_DENY_KEYS, deny_key_set
+
+
+def _search(**kwargs):
+    return {"echo": kwargs, "contact": "a@example.com", "password": "hunter2"}
+
+
+class TestEnforcerPipeline:
+    """Test how the Enforcer composes its layers."""
+
+    def test_disabled_layers_omitted_with_same_output(self):
+        """Layers disabled in the policy are left out without changing the result."""
+        engine = PolicyEngine.from_dict(
+            {
+                "policy_id": "p",
+                "version": "1.0",
+                "allow_rules": [{"tool": "search"}],
+                "validate": {"max_arg_bytes": 0},
+                "rate_limit": {"enabled": False, "limit_per_minute": 10},
+                "detect_attacks": {"enabled": False},
+                "redact": {"enabled": False},
+            }
+        )
+        enforcer = Enforcer(engine)
+        assert len(enforcer._pipeline.layers) == 1  # authorize only
+
+        policy = engine.policy
+        every_layer = Pipeline(
+            engine=engine,
+            layers=[
+                validate_layer(policy.policy_id, policy.validate_cfg),
+                rate_limit_layer(policy.policy_id, policy.rate_limit),
+                authorize_layer(engine),
+                detect_attacks_layer(policy.policy_id, policy.detect_attacks),
+                redact_layer(policy.redact),
+            ],
+        )
+        call = ToolCall(tool_name="search", arguments={"query": "DROP TABLE users"})
+        assert enforcer.enforce(call, _search) == every_layer.execute(call, _search) == _search(query="DROP TABLE users")
+
+
+class TestAuditLatency:
+    """Test the latency reported in audit events."""
+
+    def test_latency_measured_from_request_start(self, caplog):
+        """latency_ms is non-negative and covers the whole call, including the tool."""
+        engine = PolicyEngine.from_dict({"policy_id": "p", "version": "1.0", "allow_rules": [{"tool": "slow"}]})
+        logger = logging.getLogger("zero_trust_mcp.audit.test_latency")
+        enforcer = Enforcer(engine, AuditLogger(logger=logger, deny_keys=deny_key_set(DEFAULT_DENY_KEYS)))
+
+        def slow():
+            time.sleep(0.03)
+            return "done"
+
+        started = time.monotonic()
+        with caplog.at_level(logging.INFO, logger="zero_trust_mcp.audit.test_latency"):
+            assert enforcer.enforce(ToolCall(tool_name="slow"), slow) == "done"
+        elapsed_ms = (time.monotonic() - started) * 1000
+
+        event = json.loads(caplog.records[-1].getMessage())
+        assert 30 <= event["latency_ms"] <= elapsed_ms
@@ -6,8 +6,9 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from zero_trust_mcp import PolicyEngine, ToolCall
+from zero_trust_mcp import PolicyEngine, ToolCall, ToolCallCore
 from zero_trust_mcp.decisions import Decision
 
 
@@ -70,6 +71,70 @@ deny_rules:
         assert len(engine.policy.allow_rules) == 3
         assert len(engine.policy.deny_rules) == 2
 
+    def test_policy_is_read_only(self, policy_file):
+        """Test the engine's policy cannot be reassigned after its rules were indexed."""
+        engine = PolicyEngine.from_file(policy_file)
+        with pytest.raises(AttributeError):
+            engine.policy = engine.policy
+
+    def test_load_policy_from_json(self, tmp_path):
+        """Test loading a JSON policy file, and rejecting a non-object document."""
+        path = tmp_path / "policy.json"
+        path.write_text('{"policy_id": "json_policy", "version": "1.0", "allow_rules": [{"tool": "search"}]}')
+        engine = PolicyEngine.from_file(str(path))
+        assert engine.policy.policy_id == "json_policy"
+        assert engine.evaluate(ToolCall(tool_name="search")).allowed
+
+        path.write_text("[]")
+        with pytest.raises(ValueError):
+            PolicyEngine.from_file(str(path))
+
+    def test_policy_file_cached_until_changed(self, tmp_path):
+        """Test that reloads of a file return independent copies and follow content changes."""
+        import os
+
+        from zero_trust_mcp.policy.schema import AllowRule
+
+        path = tmp_path / "policy.yaml"
+        path.write_text("policy_id: first_a\nversion: '1.0'\n")
+        first = PolicyEngine.from_file(str(path)).policy
+        second = PolicyEngine.from_file(str(path)).policy
+        assert second == first and second is not first
+
+        first.allow_rules.append(AllowRule(tool="leaked"))
+        assert PolicyEngine.from_file(str(path)).policy.allow_rules == []
+
+        # same size and modification time, different content
+        stat = path.stat()
+        path.write_text("policy_id: first_b\nversion: '1.0'\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert PolicyEngine.from_file(str(path)).policy.policy_id == "first_b"
+
+    def test_policy_strings_interned(self):
+        """Test strings the engine compares on every call are interned at load time."""
+        import sys
+
+        def fresh(s):
+            return "".join(list(s))  # an equal but distinct string object
+
+        policy = PolicyEngine.from_dict(
+            {
+                "policy_id": "p",
+                "version": "1.0",
+                "allow_rules": [{"tool": fresh("lookup_tool"), "constraints": {fresh("user_key"): {"type": fresh("string")}}}],
+                "deny_rules": [{"tool": fresh("drop_tool"), "reason": fresh("no dropping"), "condition": {fresh("mode_key"): "x"}}],
+                "rate_limit": {"enabled": True, "limit_per_minute": 5, "scope": fresh("actor+tool")},
+            }
+        ).policy
+        rule, deny = policy.allow_rules[0], policy.deny_rules[0]
+        assert rule.tool is sys.intern("lookup_tool")
+        assert next(iter(rule.constraints)) is sys.intern("user_key")
+        assert rule.constraints["user_key"].type is sys.intern("string")
+        assert deny.tool is sys.intern("drop_tool")
+        assert deny.reason is sys.intern("no dropping")
+        assert next(iter(deny.condition)) is sys.intern("mode_key")
+        assert policy.rate_limit.scope is sys.intern("actor+tool")
+
     def test_evaluate_allowed_tool(self, policy_file):
         """Test evaluation of allowed tool."""
         engine = PolicyEngine.from_file(policy_file)
@@ -178,6 +243,62 @@ class TestConstraintValidation:
         decision = engine_with_constraints.evaluate(call)
         assert decision.allowed is False
 
+    def test_constraint_match_helper(self):
+        """Test Constraint.match uses the pattern compiled at load time."""
+        from zero_trust_mcp.policy.schema import Constraint
+
+        c = Constraint(type="string", pattern="^EMP[0-9]{6}$")
+        assert c.match("EMP123456")
+        assert not c.match("emp123456")
+        assert Constraint(type="string").match("anything")
+
+    def test_derived_constraint_data_never_stale(self):
+        """Test pattern, enum and role checks follow the fields, even without load-time validation."""
+        from zero_trust_mcp.policy.schema import AllowRule, Constraint, Policy
+
+        pattern = Constraint.model_construct(type="string", pattern="^EMP[0-9]{6}$")
+        rule = AllowRule.model_construct(tool="get_user", constraints={"user_id": pattern})
+        engine = PolicyEngine(Policy.model_construct(policy_id="constructed", version="1.0", allow_rules=[rule]))
+        assert not engine.evaluate(ToolCall(tool_name="get_user", arguments={"user_id": "evil"})).allowed
+        assert engine.evaluate(ToolCall(tool_name="get_user", arguments={"user_id": "EMP123456"})).allowed
+
+        c = Constraint.model_construct(type="string", pattern="^EMP[0-9]{6}$", enum=["EMP000001"])
+        assert not c.match("evil")
+        assert not c.in_enum("EMP123456")
+
+        c = Constraint(type="string", pattern="^EMP", enum=["a"])
+        c.pattern = "^ADM"
+        c.enum = ["b"]
+        assert not c.match("EMP1") and c.match("ADM1")
+        assert not c.in_enum("a") and c.in_enum("b")
+
+        copied = c.model_copy(update={"pattern": "^X", "enum": ["c"]})
+        assert copied.match("X1") and not copied.match("ADM1")
+        assert copied.in_enum("c") and not copied.in_enum("b")
+
+        c.pattern = "^EMP[0-9"
+        assert not c.match("EMP[0-9")  # an invalid pattern matches nothing
+
+        copied_rule = AllowRule(tool="t").model_copy(update={"roles": ["admin"]})
+        reassigned_rule = AllowRule(tool="t")
+        reassigned_rule.roles = ["admin"]
+        for rule in (copied_rule, reassigned_rule):
+            engine = PolicyEngine(Policy.model_construct(policy_id="roles", version="1.0", allow_rules=[rule]))
+            assert not engine.evaluate(ToolCall(tool_name="t", roles=["viewer"])).allowed
+            assert engine.evaluate(ToolCall(tool_name="t", roles=["admin"])).allowed
+
+    def test_invalid_pattern_rejected_at_load(self):
+        """Test that a malformed regex fails when the policy is loaded."""
+        policy_dict = {
+            "policy_id": "bad_pattern",
+            "version": "1.0",
+            "allow_rules": [
+                {"tool": "get_user", "constraints": {"user_id": {"type": "string", "pattern": "^EMP[0-9"}}},
+            ],
+        }
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
+            PolicyEngine.from_dict(policy_dict)
+
 
 class TestDenyRules:
     """Test deny rule evaluation."""
@@ -306,3 +427,138 @@ class TestToolCallModel:
         """Test ToolCall with no arguments."""
         call = ToolCall(tool_name="list_all")
         assert call.arguments == {}
+
+    def test_arguments_size_bytes(self):
+        """Test arguments are sized as compact JSON, including ints orjson cannot encode."""
+        call = ToolCall(tool_name="t", arguments={"a": [1, "é"], "big": 2**64})
+        assert call.arguments_size_bytes() == len('{"a":[1,"é"],"big":18446744073709551616}'.encode())
+
+        cyclic: list = []
+        cyclic.append(cyclic)
+        assert ToolCall(tool_name="t", arguments={"c": cyclic}).arguments_size_bytes() >= 1_000_000_000
+
+    def test_parse_returns_core(self):
+        """Test ToolCall.parse validates input and returns the pipeline representation."""
+        core = ToolCall.parse({"tool_name": "search", "arguments": {"query": "q"}, "roles": ["viewer"]})
+        assert isinstance(core, ToolCallCore)
+        assert core.tool_name == "search"
+        assert core.roles == ["viewer"]
+        assert ToolCall.parse(core) is core
+
+        with pytest.raises(ValidationError):
+            ToolCall.parse({"arguments": {}})
+
+    def test_engine_accepts_core(self):
+        """Test PolicyEngine gives the same decision for ToolCall and ToolCallCore."""
+        engine = PolicyEngine.from_dict(
+            {
+                "policy_id": "p",
+                "version": "1.0",
+                "default": "deny",
+                "allow_rules": [{"tool": "search", "constraints": {"query": {"type": "string"}}}],
+            }
+        )
+        for call in (ToolCall(tool_name="search", arguments={"query": "q"}),
+                     ToolCallCore(tool_name="search", arguments={"query": "q"})):
+            assert engine.evaluate(call).allowed
+
+
+class TestDecisionCache:
+    """Test memoization of policy decisions."""
+
+    @pytest.fixture
+    def policy_dict(self):
+        """Policy with a role-restricted rule."""
+        return {
+            "policy_id": "cache_test",
+            "version": "1.0",
+            "default": "deny",
+            "allow_rules": [
+                {
+                    "tool": "search",
+                    "roles": ["support", "admin"],
+                    "constraints": {"query": {"type": "string"}},
+                },
+            ],
+        }
+
+    def test_repeat_call_served_from_cache(self, policy_dict):
+        """Identical calls return the same cached Decision."""
+        engine = PolicyEngine.from_dict(policy_dict)
+        first = engine.evaluate(ToolCall(tool_name="search", arguments={"query": "a"}, roles=["support", "admin"]))
+        second = engine.evaluate(ToolCall(tool_name="search", arguments={"query": "a"}, roles=["admin", "support"]))
+        assert first.allowed is True
+        assert second is first
+
+    def test_cache_distinguishes_argument_types(self, policy_dict):
+        """Values that compare equal across types are cached separately."""
+        engine = PolicyEngine.from_dict(policy_dict)
+        ok = engine.evaluate(ToolCall(tool_name="search", arguments={"query": "1"}, roles=["support"]))
+        bad = engine.evaluate(ToolCall(tool_name="search", arguments={"query": 1}, roles=["support"]))
+        assert ok.allowed is True
+        assert bad.allowed is False
+
+    def test_uncacheable_arguments_bypass_cache(self, policy_dict):
+        """Arguments that are not JSON-like are evaluated without caching."""
+        engine = PolicyEngine.from_dict(policy_dict)
+        call = ToolCall(tool_name="search", arguments={"query": "a", "tags": {"x"}}, roles=["support"])
+        assert engine.evaluate(call).allowed is True
+        assert len(engine._decision_cache) == 0
+
+    def test_deep_large_and_cyclic_arguments_bypass_cache(self, policy_dict):
+        """Deep, large or cyclic arguments get a decision without being cached."""
+        engine = PolicyEngine.from_dict(policy_dict)
+        deep: list = []
+        for _ in range(5000):
+            deep = [deep]
+        cyclic: list = []
+        cyclic.append(cyclic)
+        for extra in (deep, cyclic, "x" * 10_000):
+            call = ToolCall(tool_name="search", arguments={"query": "a", "extra": extra}, roles=["support"])
+            assert engine.evaluate(call).allowed is True
+        assert len(engine._decision_cache) == 0
+
+    def test_cache_is_bounded(self, policy_dict):
+        """The least recently used entry is evicted once the cache is full."""
+        engine = PolicyEngine(PolicyEngine.from_dict(policy_dict).policy, cache_size=2)
+        for q in ("a", "b", "c"):
+            engine.evaluate(ToolCall(tool_name="search", arguments={"query": q}, roles=["support"]))
+        assert len(engine._decision_cache) == 2
+
+
+class TestRuleIndex:
+    """Test per-tool rule lookup and wildcard rules."""
+
+    @pytest.fixture
+    def engine_with_wildcards(self):
+        """Create engine with tool-specific and wildcard rules."""
+        policy_dict = {
+            "policy_id": "wildcard_test",
+            "version": "1.0",
+            "default": "deny",
+            "allow_rules": [
+                {"tool": "search", "constraints": {"query": {"type": "string"}}},
+                {"tool": "*", "roles": ["admin"]},
+            ],
+            "deny_rules": [
+                {"tool": "*", "condition": {"format": "csv"}, "reason": "CSV exports not allowed"},
+            ],
+        }
+        return PolicyEngine.from_dict(policy_dict)
+
+    def test_specific_rule_takes_precedence(self, engine_with_wildcards):
+        """Test that a tool-specific allow rule is used before the wildcard."""
+        call = ToolCall(tool_name="search", arguments={"query": "x"})
+        assert engine_with_wildcards.evaluate(call).allowed is True
+
+    def test_wildcard_allow_applies_to_unlisted_tools(self, engine_with_wildcards):
+        """Test that the wildcard allow rule covers tools with no rule of their own."""
+        assert engine_with_wildcards.evaluate(ToolCall(tool_name="export", roles=["admin"])).allowed is True
+        assert engine_with_wildcards.evaluate(ToolCall(tool_name="export", roles=["support"])).allowed is False
+
+    def test_wildcard_deny_applies_to_every_tool(self, engine_with_wildcards):
+        """Test that a wildcard deny rule overrides tool-specific allow rules."""
+        call = ToolCall(tool_name="search", arguments={"query": "x", "format": "csv"})
+        decision = engine_with_wildcards.evaluate(call)
+        assert decision.allowed is False
+        assert decision.reason == "CSV exports not allowed"
@@ -0,0 +1,93 @@
+"""
+Unit tests for the in-memory token-bucket rate limiter.
+"""
+
+import pytest
+
+from zero_trust_mcp import Enforcer, PolicyDeniedError, PolicyEngine, ToolCall, rate_limit
+from zero_trust_mcp.rate_limit import InMemoryRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock (nanoseconds)."""
+    now = [1_000_000_000]
+    monkeypatch.setattr(rate_limit, "_monotonic_ns", lambda: now[0])
+    return now
+
+
+class TestInMemoryRateLimiter:
+    """Test token-bucket accounting."""
+
+    def test_burst_then_deny(self, clock):
+        """Test that a fresh key may spend its burst and is then denied."""
+        limiter = InMemoryRateLimiter()
+        results = [limiter.allow("k", limit_per_minute=60, burst=2) for _ in range(3)]
+        assert [ok for ok, _ in results] == [True, True, False]
+        assert results[0][1] == {"limit": 60, "burst": 2, "remaining": 1}
+
+    def test_refill_over_time(self, clock):
+        """Test that tokens refill at limit_per_minute and never exceed capacity."""
+        limiter = InMemoryRateLimiter()
+        for _ in range(2):
+            limiter.allow("k", limit_per_minute=60, burst=2)
+        assert not limiter.allow("k", limit_per_minute=60, burst=2)[0]
+
+        clock[0] += 1_000_000_000  # one second -> one token at 60/min
+        assert limiter.allow("k", limit_per_minute=60, burst=2) == (
+            True,
+            {"limit": 60, "burst": 2, "remaining": 0},
+        )
+
+        clock[0] += 3600 * 1_000_000_000
+        assert limiter.allow("k", limit_per_minute=60, burst=2)[1]["remaining"] == 1
+
+    def test_keys_are_independent(self, clock):
+        """Test that each key has its own bucket."""
+        limiter = InMemoryRateLimiter()
+        assert limiter.allow("a", limit_per_minute=1, burst=1)[0]
+        assert not limiter.allow("a", limit_per_minute=1, burst=1)[0]
+        assert limiter.allow("b", limit_per_minute=1, burst=1)[0]
+
+    def test_least_recently_used_key_evicted(self, clock):
+        """Test that the bucket map is bounded and evicts the coldest key."""
+        limiter = InMemoryRateLimiter(max_keys=2)
+        for key in ("a", "b"):
+            limiter.allow(key, limit_per_minute=1, burst=1)
+        limiter.allow("a", limit_per_minute=1, burst=1)  # touch "a"; "b" is now coldest
+        limiter.allow("c", limit_per_minute=1, burst=1)
+
+        assert list(limiter._buckets) == ["a", "c"]
+        assert limiter.allow("b", limit_per_minute=1, burst=1)[0]  # evicted: fresh bucket
+
+
+class TestPluggableLimiter:
+    """Test that the Enforcer uses a supplied RateLimiter backend."""
+
+    def test_enforcer_uses_supplied_limiter(self):
+        """Test that keys are routed to the given backend and its verdict is enforced."""
+
+        class Recording:
+            def __init__(self):
+                self.keys = []
+
+            def allow(self, key, limit_per_minute, burst):
+                self.keys.append(key)
+                return len(self.keys) == 1, {"limit": limit_per_minute, "burst": burst, "remaining": 0}
+
+        engine = PolicyEngine.from_dict(
+            {
+                "policy_id": "p",
+                "version": "1.0",
+                "allow_rules": [{"tool": "search"}],
+                "rate_limit": {"enabled": True, "limit_per_minute": 60, "scope": "actor"},
+            }
+        )
+        backend = Recording()
+        enforcer = Enforcer(engine, rate_limiter=backend)
+        call = ToolCall(tool_name="search", actor="alice")
+
+        assert enforcer.enforce(call, lambda: "ok") == "ok"
+        with pytest.raises(PolicyDeniedError):
+            enforcer.enforce(call, lambda: "ok")
+        assert backend.keys == ["actor:alice", "actor:alice"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for output redaction.
+"""
+
+import pytest
+
+from zero_trust_mcp.redaction import make_redactor, redact_value
+
+
+class TestRedactValue:
+    """Test redact_value on nested tool results."""
+
+    def test_deny_keys_case_insensitive(self):
+        """Test that deny keys match regardless of case, at any depth."""
+        value = {"Password": "hunter2", "user": {"TOKEN": "abc", "name": "ada"}}
+        out = redact_value(value, deny_keys=["password", "token"])
+        assert out == {"Password": "[REDACTED]", "user": {"TOKEN": "[REDACTED]", "name": "ada"}}
+
+    def test_large_deny_list(self):
+        """Test that long custom deny lists still match keys exactly and case-insensitively."""
+        deny = [f"secret_{i}" for i in range(500)] + ["Session"]
+        value = {"SECRET_499": "a", "secret_5000": "b", "session": "c", "sessions": "d"}
+        out = redact_value(value, deny_keys=deny)
+        assert out == {"SECRET_499": "[REDACTED]", "secret_5000": "b", "session": "[REDACTED]", "sessions": "d"}
+
+    def test_containers_preserved(self):
+        """Test that lists, tuples and key order survive redaction."""
+        value = {"b": [1, ("x@example.com", 2.5)], "a": (True, None)}
+        out = redact_value(value)
+        assert out == {"b": [1, ("[REDACTED_EMAIL]", 2.5)], "a": (True, None)}
+        assert list(out) == ["b", "a"]
+        assert isinstance(out["b"][1], tuple)
+
+    def test_pii_and_truncation(self):
+        """Test email/phone scrubbing and long-string truncation."""
+        out = redact_value(
+            ["mail bob@example.com", "call 555-123-4567", "x" * 10],
+            pii_phones=True,
+            max_string_len=8,
+        )
+        assert out == ["mail bob…", "call 555…", "xxxxxxxx…"]
+        assert redact_value("call 555-123-4567", pii_phones=True) == "call [REDACTED_PHONE]"
+
+    def test_emails_and_phones_in_one_string(self):
+        """Test that both PII kinds are scrubbed together, and each only when enabled."""
+        s = "mail a@example.com or call 555-123-4567"
+        assert redact_value(s, pii_phones=True) == "mail [REDACTED_EMAIL] or call [REDACTED_PHONE]"
+        assert redact_value(s) == "mail [REDACTED_EMAIL] or call 555-123-4567"
+        assert redact_value(s, pii_emails=False, pii_phones=True) == "mail a@example.com or call [REDACTED_PHONE]"
+        assert redact_value(s, pii_emails=False) == s
+
+    def test_string_lists_scrubbed_per_item(self):
+        """Test that batched list scrubbing never matches across item boundaries."""
+        value = ["555", "123", "4567", "a@b.io", "tel 555-123-4567", "x\x00y@b.io"]
+        out = redact_value(value, pii_phones=True)
+        assert out == ["555", "123", "4567", "[REDACTED_EMAIL]", "tel [REDACTED_PHONE]", "x\x00[REDACTED_EMAIL]"]
+        assert redact_value(("a@b.io", "c@d.io")) == ("[REDACTED_EMAIL]", "[REDACTED_EMAIL]")
+
+    def test_colliding_keys_keep_last_value(self):
+        """Test that keys stringifying to the same key keep the last value, like a dict would."""
+        assert redact_value({1: ["a"], "1": "s"}) == {"1": "s"}
+        assert redact_value({1: "x@y.com", "1": 5}) == {"1": 5}
+        assert redact_value({1: "s", "1": ["b@c.io"]}) == {"1": ["[REDACTED_EMAIL]"]}
+
+    def test_make_redactor_reuses_settings(self):
+        """Test that a prebuilt redactor matches redact_value with the same settings."""
+        redact = make_redactor(deny_keys=["ssn"], pii_phones=True, max_string_len=0)
+        value = {"SSN": "123", "note": "call 555-123-4567 or a@b.io " + "x" * 3000}
+        assert redact(value) == redact_value(value, deny_keys=["ssn"], pii_phones=True, max_string_len=0)
+        assert redact(value)["SSN"] == "[REDACTED]"
+        assert redact({"ssn": 1}) == {"ssn": "[REDACTED]"}
+
+    def test_unknown_objects_stringified(self):
+        """Test that unknown objects are stringified and scrubbed."""
+
+        class Obj:
+            def __str__(self):
+                return "owner=bob@example.com"
+
+        assert redact_value({"obj": Obj()}) == {"obj": "owner=[REDACTED_EMAIL]"}
+
+    def test_unknown_containers_redacted(self):
+        """Test that sets, bytes and other unknown containers are redacted, not stringified."""
+
+        class Box:
+            def __len__(self):
+                return 1
+
+        value = {"tags": {"hunter2"}, "raw": b"token=abc", "box": Box(), "n": frozenset()}
+        assert redact_value(value) == {"tags": "[REDACTED]", "raw": "[REDACTED]", "box": "[REDACTED]", "n": "[REDACTED]"}
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Test that deep (but bounded) structures are walked without recursion."""
+        value: list = ["a@b.io"]
+        for _ in range(900):
+            value = [value]
+        out = redact_value(value)
+        for _ in range(900):
+            out = out[0]
+        assert out == ["[REDACTED_EMAIL]"]
+
+    def test_cycles_rejected(self):
+        """Test that self-referencing structures fail instead of looping forever."""
+        value: list = []
+        value.append(value)
+        with pytest.raises(RecursionError):
+            redact_value(value)
+
+    def test_hyperscan_prefilter_matches_re(self):
+        """Test that the optional Hyperscan prefilter never changes redaction output."""
+        pytest.importorskip("hyperscan")
+        from zero_trust_mcp.redaction import PHONE_RE, _SCRUBBERS
+
+        pad = "lorem ipsum " * 8
+        for s in [pad, pad + "a@example.com", pad + "555\x1c123\x1c4567", pad + "x" * 2048 + "…"]:
+            expected = PHONE_RE.sub("[REDACTED_PHONE]", s)
+            assert _SCRUBBERS[False, True](s) == expected